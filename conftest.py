@@ -0,0 +1,20 @@
+"""
+Shared pytest configuration.
+
+Sets the Obsidian/API environment once, at collection time, so individual
+test modules don't each repeat the setup before importing the package.
+"""
+
+import os
+
+_TEST_ENV = {
+    'OBSIDIAN_API_KEY': '07452926311ed660b8a3d309a2581979dbe404a393375635c20873e94aadb870',
+    'OBSIDIAN_PROTOCOL': 'http',
+    'OBSIDIAN_HOST': 'secondbrain.oihugudev.com.br',
+    'OBSIDIAN_PORT': '80',
+    'JWT_SECRET_KEY': 'test-secret-key-for-development',
+    'API_KEYS': 'test-key-123,test-key-456',
+}
+
+for _key, _value in _TEST_ENV.items():
+    os.environ.setdefault(_key, _value)
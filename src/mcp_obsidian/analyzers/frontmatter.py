@@ -7,11 +7,81 @@ Analyzes frontmatter patterns across notes to infer schemas
 and suggest improvements.
 """
 
+import re
 from typing import Dict, List, Optional, Any, Set
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from ..obsidian import Obsidian
 
+# Frontmatter scanning without a full YAML parse: grab the leading
+# "---" block, then one "key: value" pair per line. Whitespace around
+# the colon is restricted to spaces/tabs — \s would match newlines and
+# let an empty-valued field swallow the following line.
+_FRONTMATTER_BLOCK_RE = re.compile(r"\A---\n(.*?)\n---", re.DOTALL)
+_FRONTMATTER_FIELD_RE = re.compile(r"^([A-Za-z_][\w-]*)[ \t]*:[ \t]*(.*)$", re.MULTILINE)
+_BLOCK_LIST_ITEM_RE = re.compile(r"^[ \t]+-[ \t]*(.*)$")
+
+
+def _coerce_scalar(raw: str) -> Any:
+    """Best-effort conversion of a raw frontmatter value to a Python value.
+
+    Only needs to be accurate enough for type classification; nested YAML
+    structures are not resolved.
+    """
+    raw = raw.strip()
+    if raw in ("", "null", "~"):
+        return None
+    if raw == "true":
+        return True
+    if raw == "false":
+        return False
+    if raw.startswith("["):
+        return [item.strip() for item in raw[1:-1].split(",") if item.strip()]
+    if raw.startswith("{"):
+        return {}
+    try:
+        return int(raw)
+    except ValueError:
+        pass
+    try:
+        return float(raw)
+    except ValueError:
+        pass
+    return raw.strip("'\"")
+
+
+def _fast_frontmatter_fields(text: str) -> Dict[str, Any]:
+    """Extract top-level frontmatter fields from raw markdown.
+
+    A linear regex scan is an order of magnitude cheaper than yaml.safe_load
+    and sufficient for schema inference, which only needs field names and
+    approximate value types.
+    """
+    block = _FRONTMATTER_BLOCK_RE.match(text)
+    if not block:
+        return {}
+
+    fields: Dict[str, Any] = {}
+    open_key = None  # last field with an empty value; may start a block list
+    for line in block.group(1).splitlines():
+        match = _FRONTMATTER_FIELD_RE.match(line)
+        if match:
+            key, raw = match.groups()
+            fields[key] = _coerce_scalar(raw)
+            open_key = key if raw.strip() == "" else None
+            continue
+        if open_key is not None:
+            # "key:" followed by indented "- item" lines is the standard
+            # Obsidian idiom for lists; collect them so the field
+            # classifies as an array rather than null.
+            item = _BLOCK_LIST_ITEM_RE.match(line)
+            if item:
+                if not isinstance(fields[open_key], list):
+                    fields[open_key] = []
+                fields[open_key].append(_coerce_scalar(item.group(1)))
+    return fields
+
 
 class FrontmatterAnalyzer:
     """Analyzes frontmatter patterns and suggests schemas."""
@@ -28,7 +98,8 @@ class FrontmatterAnalyzer:
     def analyze_frontmatter_in_folder(
         self,
         folder_path: str,
-        sample_size: int = 20
+        sample_size: int = 20,
+        validate: bool = False
     ) -> Dict[str, Any]:
         """
         Analyze frontmatter patterns in a specific folder.
@@ -36,13 +107,15 @@ class FrontmatterAnalyzer:
         Args:
             folder_path: Path to folder to analyze
             sample_size: Number of files to sample
+            validate: Use fully parsed frontmatter instead of the fast
+                regex scan. Slower, but exact for unusual YAML.
 
         Returns:
             Dictionary with frontmatter analysis
         """
         try:
             # Get list of markdown files in folder
-            result = self.client.list_files_in_directory(folder_path)
+            result = self.client.cached_list_files_in_directory(folder_path)
             files = [
                 f for f in result.get("files", [])
                 if f.endswith(".md") and not f.endswith("/")
@@ -51,13 +124,18 @@ class FrontmatterAnalyzer:
             if not files:
                 return {"error": "No markdown files found in folder"}
 
-            # Sample files
+            # Sample files and fetch them concurrently; the per-note HTTP
+            # round-trip dominates, so threads collapse N * RTT into
+            # roughly ceil(N / workers) * RTT.
             sample_files = files[:min(sample_size, len(files))]
-            frontmatters = []
+            filepaths = [f"{folder_path}/{filename}" for filename in sample_files]
+
+            fetch = self._get_note_metadata if validate else self._get_note_fields
+            with ThreadPoolExecutor(max_workers=min(16, len(filepaths))) as executor:
+                notes_data = list(executor.map(fetch, filepaths))
 
-            for filename in sample_files:
-                filepath = f"{folder_path}/{filename}"
-                note_data = self._get_note_metadata(filepath)
+            frontmatters = []
+            for filename, note_data in zip(sample_files, notes_data):
                 if note_data:
                     frontmatter = note_data.get("frontmatter", {})
                     if frontmatter:  # Only include notes with frontmatter
@@ -77,7 +155,7 @@ class FrontmatterAnalyzer:
             # Analyze collected frontmatter
             schema = self._build_schema(frontmatters)
             suggestions = self._generate_suggestions(schema, frontmatters)
-            common_fields = self._find_common_fields(frontmatters)
+            common_fields = self._find_common_fields(schema)
             missing_fields = self._find_missing_fields(frontmatters, common_fields)
 
             return {
@@ -185,11 +263,20 @@ class FrontmatterAnalyzer:
     def _get_note_metadata(self, filepath: str) -> Optional[Dict[str, Any]]:
         """Get note metadata including frontmatter."""
         try:
-            return self.client.get_file_contents(filepath, return_json=True)
+            return self.client.cached_get_file_contents(filepath, return_json=True)
         except Exception as e:
             logger.debug(f"Error getting note metadata for {filepath}: {e}")
             return None
 
+    def _get_note_fields(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """Get note frontmatter via the fast regex scan of raw markdown."""
+        try:
+            content = self.client.cached_get_file_contents(filepath)
+            return {"frontmatter": _fast_frontmatter_fields(content)}
+        except Exception as e:
+            logger.debug(f"Error getting note fields for {filepath}: {e}")
+            return None
+
     def _build_schema(self, frontmatters: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Build schema from multiple frontmatter examples.
@@ -208,9 +295,8 @@ class FrontmatterAnalyzer:
 
         for item in frontmatters:
             fm = item["frontmatter"]
+            field_counter.update(fm.keys())  # C-level bulk increment
             for key, value in fm.items():
-                field_counter[key] += 1
-
                 # Track type
                 value_type = self._get_value_type(value)
                 field_types[key][value_type] += 1
@@ -254,32 +340,26 @@ class FrontmatterAnalyzer:
 
     def _find_common_fields(
         self,
-        frontmatters: List[Dict[str, Any]],
+        schema: Dict[str, Any],
         threshold: float = 0.5
     ) -> List[str]:
         """
         Find fields that appear in at least threshold% of notes.
 
+        Reuses the frequencies already computed by _build_schema instead of
+        re-counting the frontmatters.
+
         Args:
-            frontmatters: List of frontmatter dicts
+            schema: Schema produced by _build_schema
             threshold: Minimum frequency (0-1) to be considered common
 
         Returns:
             List of common field names
         """
-        field_counter = Counter()
-        total = len(frontmatters)
-
-        for item in frontmatters:
-            for key in item["frontmatter"].keys():
-                field_counter[key] += 1
-
-        common = [
-            field for field, count in field_counter.items()
-            if (count / total) >= threshold
-        ]
-
-        return sorted(common)
+        return sorted(
+            field for field, info in schema.items()
+            if info["frequency"] >= threshold
+        )
 
     def _find_missing_fields(
         self,
@@ -14,6 +14,18 @@ from pathlib import Path
 
 from ..obsidian import Obsidian
 
+# Patterns and keywords used for classification, compiled/built once at
+# import instead of per analysis call.
+_YEAR_RE = re.compile(r"^\d{4}$")
+_MONTH_RE = re.compile(r"^\d{2} - \w+")
+_WEEK_RE = re.compile(r"^W\d{2}$")
+_DAILY_NOTE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\.md$")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+
+_DAILY_KEYWORDS = ("daily", "journal", "diário", "diario")
+_PEOPLE_KEYWORDS = ("people", "person", "contact", "pessoas")
+_PROJECT_KEYWORDS = ("project", "projeto", "work")
+
 
 class VaultStructureAnalyzer:
     """Analyzes vault structure to detect organizational patterns."""
@@ -27,6 +39,10 @@ class VaultStructureAnalyzer:
         """
         self.client = obsidian_client
 
+        # Memoized subtree explorations, shared by the per-component
+        # analyses within a single analyze_vault_structure() run.
+        self._subtree_cache: Dict[tuple, Dict[str, Any]] = {}
+
     def analyze_vault_structure(self) -> Dict[str, Any]:
         """
         Analyze complete vault structure.
@@ -34,6 +50,14 @@ class VaultStructureAnalyzer:
         Returns:
             Dictionary containing detected patterns and structure info
         """
+        # Fresh cache per top-level run; within the run, subtrees reached
+        # via multiple paths are explored only once.
+        self._subtree_cache.clear()
+
+        # One bulk fetch instead of a round-trip per folder, when the
+        # server supports it.
+        self._prefetch_listings()
+
         # Get root folders
         root_folders = self._get_root_folders()
 
@@ -54,6 +78,33 @@ class VaultStructureAnalyzer:
             "statistics": self._calculate_statistics()
         }
 
+    def _prefetch_listings(self) -> None:
+        """Seed the client's listing cache from one recursive vault fetch.
+
+        Turns the per-folder requests issued during exploration into dict
+        lookups. A server without recursive listing support simply leaves
+        the cache empty and the per-folder walk proceeds as before.
+        """
+        try:
+            paths = self.client.list_vault_recursive()
+        except Exception as e:
+            logger.debug(f"Recursive listing unavailable, using per-folder requests: {e}")
+            return
+
+        tree: Dict[str, set] = defaultdict(set)
+        for path in paths:
+            is_folder = path.endswith("/")
+            parts = path.rstrip("/").split("/")
+            for depth, name in enumerate(parts):
+                parent = "/".join(parts[:depth])
+                if depth < len(parts) - 1 or is_folder:
+                    name += "/"
+                tree[parent].add(name)
+
+        self.client.prime_list_cache(
+            {dirpath: {"files": sorted(entries)} for dirpath, entries in tree.items()}
+        )
+
     def _get_root_folders(self) -> List[str]:
         """Get list of root folders in the vault."""
         try:
@@ -80,7 +131,7 @@ class VaultStructureAnalyzer:
         # Look for common daily notes folder names
         daily_folders = [
             f for f in root_folders
-            if any(keyword in f.lower() for keyword in ["daily", "journal", "diário", "diario"])
+            if any(keyword in f.lower() for keyword in _DAILY_KEYWORDS)
         ]
 
         if not daily_folders:
@@ -132,7 +183,7 @@ class VaultStructureAnalyzer:
         # Look for people-related folders
         people_folders = [
             f for f in root_folders
-            if any(keyword in f.lower() for keyword in ["people", "person", "contact", "pessoas"])
+            if any(keyword in f.lower() for keyword in _PEOPLE_KEYWORDS)
         ]
 
         if not people_folders:
@@ -142,7 +193,7 @@ class VaultStructureAnalyzer:
 
         try:
             # Get list of people notes
-            result = self.client.list_files_in_directory(people_folder)
+            result = self.client.cached_list_files_in_directory(people_folder)
             people_files = [
                 f for f in result.get("files", [])
                 if f.endswith(".md") and not f.endswith("/")
@@ -183,7 +234,7 @@ class VaultStructureAnalyzer:
         # Look for project-related folders
         project_folders = [
             f for f in root_folders
-            if any(keyword in f.lower() for keyword in ["project", "projeto", "work"])
+            if any(keyword in f.lower() for keyword in _PROJECT_KEYWORDS)
         ]
 
         if not project_folders:
@@ -240,8 +291,14 @@ class VaultStructureAnalyzer:
         if current_depth >= max_depth:
             return {"path": folder_path, "truncated": True}
 
+        key = (folder_path, max_depth, current_depth)
+        try:
+            return self._subtree_cache[key]
+        except KeyError:
+            pass
+
         try:
-            result = self.client.list_files_in_directory(folder_path)
+            result = self.client.cached_list_files_in_directory(folder_path)
             items = result.get("files", [])
 
             structure = {
@@ -266,6 +323,7 @@ class VaultStructureAnalyzer:
                     # It's a file
                     structure["files"].append(item)
 
+            self._subtree_cache[key] = structure
             return structure
         except Exception as e:
             return {"path": folder_path, "error": str(e)}
@@ -284,7 +342,7 @@ class VaultStructureAnalyzer:
         folders = structure.get("folders", [])
         folder_names = [Path(f.get("path", "")).name for f in folders]
 
-        year_pattern = any(re.match(r"^\d{4}$", name) for name in folder_names)
+        year_pattern = any(_YEAR_RE.match(name) for name in folder_names)
 
         if year_pattern:
             # Check if there are month folders inside year folders
@@ -292,12 +350,12 @@ class VaultStructureAnalyzer:
             week_pattern = False
 
             for year_folder in folders:
-                if re.match(r"^\d{4}$", Path(year_folder.get("path", "")).name):
+                if _YEAR_RE.match(Path(year_folder.get("path", "")).name):
                     # Check subfolders for month pattern
                     month_folders = year_folder.get("folders", [])
                     month_names = [Path(f.get("path", "")).name for f in month_folders]
 
-                    if any(re.match(r"^\d{2} - \w+", name) for name in month_names):
+                    if any(_MONTH_RE.match(name) for name in month_names):
                         month_pattern = True
 
                         # Check if there are week folders inside month folders
@@ -305,7 +363,7 @@ class VaultStructureAnalyzer:
                             week_folders = month_folder.get("folders", [])
                             week_names = [Path(f.get("path", "")).name for f in week_folders]
 
-                            if any(re.match(r"^W\d{2}$", name) for name in week_names):
+                            if any(_WEEK_RE.match(name) for name in week_names):
                                 week_pattern = True
                                 break
 
@@ -322,7 +380,7 @@ class VaultStructureAnalyzer:
 
         # Check files for date patterns
         files = structure.get("files", [])
-        if any(re.match(r"^\d{4}-\d{2}-\d{2}\.md$", f) for f in files):
+        if any(_DAILY_NOTE_RE.match(f) for f in files):
             return "Daily Notes/YYYY-MM-DD.md"
 
         return "Custom/Unknown pattern"
@@ -367,7 +425,7 @@ class VaultStructureAnalyzer:
         def search_structure(struct: Dict[str, Any], base_path: str = "") -> Optional[str]:
             files = struct.get("files", [])
             for file in files:
-                if re.match(r"^\d{4}-\d{2}-\d{2}\.md$", file):
+                if _DAILY_NOTE_RE.match(file):
                     return f"{base_path}/{file}".lstrip("/")
 
             for folder in struct.get("folders", []):
@@ -422,7 +480,7 @@ class VaultStructureAnalyzer:
             Dictionary with note data or None
         """
         try:
-            return self.client.get_file_contents(file_path, return_json=True)
+            return self.client.cached_get_file_contents(file_path, return_json=True)
         except Exception as e:
             logger.debug(f"Error getting note metadata for {file_path}: {e}")
             return None
@@ -440,7 +498,7 @@ class VaultStructureAnalyzer:
         sections = []
         for line in content.split("\n"):
             # Match markdown headings (### Heading)
-            match = re.match(r"^(#{1,6})\s+(.+)$", line.strip())
+            match = _HEADING_RE.match(line.strip())
             if match:
                 sections.append(match.group(2).strip())
         return sections
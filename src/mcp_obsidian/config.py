@@ -7,8 +7,10 @@ This module handles vault configuration, including auto-detection of
 structure patterns, frontmatter schemas, and user preferences.
 """
 
+import functools
 import json
 import os
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional
 from dataclasses import dataclass, field, asdict
@@ -89,6 +91,11 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.config: VaultConfig = self._load_or_create_config()
 
+        # In-memory cache of the last full vault-structure analysis, so
+        # warm runs can skip the vault traversal entirely.
+        self.analysis_cache: Dict[str, Any] = {}
+        self.last_analyzed_at: Optional[datetime] = None
+
     def _load_or_create_config(self) -> VaultConfig:
         """Load existing config or create default one."""
         if self.config_path.exists():
@@ -137,6 +144,14 @@ class ConfigManager:
             logger.debug(f"Configuration saved to {self.config_path}")
         except Exception as e:
             logger.debug(f"Error saving config: {e}")
+        self._invalidate_lookup_caches()
+
+    def _invalidate_lookup_caches(self) -> None:
+        """Drop memoized pattern lookups after the config changes."""
+        ConfigManager.get_daily_notes_pattern.cache_clear()
+        ConfigManager.get_people_folder.cache_clear()
+        ConfigManager.get_project_folders.cache_clear()
+        ConfigManager.get_project_folder_prefixes.cache_clear()
 
     def update_detected_patterns(
         self,
@@ -171,27 +186,48 @@ class ConfigManager:
         if vault_folders:
             self.config.vault_root_folders = vault_folders
 
-        from datetime import datetime
         self.config.last_analyzed = datetime.now().isoformat()
-
+        self._invalidate_lookup_caches()
+
+    def store_analysis(self, analysis: Dict[str, Any]) -> None:
+        """Remember the latest vault-structure analysis for warm-run reuse."""
+        self.analysis_cache = dict(analysis)
+        self.last_analyzed_at = datetime.now()
+
+    def get_cached_analysis(self, max_age_hours: float = 24.0) -> Optional[Dict[str, Any]]:
+        """Return the last analysis if it is younger than max_age_hours, else None."""
+        if not self.analysis_cache or self.last_analyzed_at is None:
+            return None
+        if datetime.now() - self.last_analyzed_at > timedelta(hours=max_age_hours):
+            return None
+        return self.analysis_cache
+
+    @functools.lru_cache(maxsize=None)
     def get_daily_notes_pattern(self) -> Optional[str]:
         """Get the daily notes path pattern (user-defined or detected)."""
         if self.config.daily_notes.path_pattern != "auto-detect":
             return self.config.daily_notes.path_pattern
         return self.config.daily_notes.detected_pattern
 
+    @functools.lru_cache(maxsize=None)
     def get_people_folder(self) -> Optional[str]:
         """Get the people folder (user-defined or detected)."""
         if self.config.people.folder != "auto-detect":
             return self.config.people.folder
         return self.config.people.detected_folder
 
+    @functools.lru_cache(maxsize=None)
     def get_project_folders(self) -> list[str]:
         """Get project folders (user-defined or detected)."""
         if self.config.projects.folders != ["auto-detect"]:
             return self.config.projects.folders
         return self.config.projects.detected_folders
 
+    @functools.lru_cache(maxsize=None)
+    def get_project_folder_prefixes(self) -> tuple[str, ...]:
+        """Get project folders as a tuple usable directly by str.startswith."""
+        return tuple(sorted(self.get_project_folders()))
+
     def is_feature_enabled(self, feature: str) -> bool:
         """Check if a feature is enabled."""
         return getattr(self.config.features, feature, False)
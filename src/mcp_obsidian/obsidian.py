@@ -24,6 +24,23 @@ class Obsidian():
         self.verify_ssl = verify_ssl
         self.timeout = (3, 6)
 
+        # One keep-alive session per client: pooled connections skip the
+        # TCP (and TLS) handshake on every call after the first.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+        # Request-scoped memoization for repeated reads within one tool call.
+        self._list_cache: dict[str, Any] = {}
+        self._get_cache: dict[tuple[str, bool], Any] = {}
+
+        # Process-lifetime content cache validated by ETag: survives
+        # clear_request_cache() because a conditional GET detects staleness
+        # exactly, turning repeat reads of unchanged files into 304s with
+        # header-only payloads.
+        self._etag_cache: dict[tuple[str, bool], tuple[str, Any]] = {}
+
     def get_base_url(self) -> str:
         return f'{self.protocol}://{self.host}:{self.port}'
     
@@ -48,7 +65,7 @@ class Obsidian():
         url = f"{self.get_base_url()}/vault/"
 
         def call_fn():
-            response = requests.get(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.get(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
 
             return response.json()
@@ -60,7 +77,7 @@ class Obsidian():
         url = f"{self.get_base_url()}/vault/{dirpath}/"
 
         def call_fn():
-            response = requests.get(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.get(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
 
             return response.json()
@@ -71,43 +88,135 @@ class Obsidian():
         """Alias for list_files_in_dir for consistency."""
         return self.list_files_in_dir(dirpath)
 
+    def list_vault_recursive(self) -> list[str]:
+        """List every path in the vault with a single request.
+
+        Asks the REST API for a recursive listing so callers can build the
+        folder tree in memory instead of issuing one request per folder.
+        Raises if the server does not support recursive listing.
+
+        Returns:
+            Flat list of vault-relative paths; folders end with "/".
+        """
+        url = f"{self.get_base_url()}/vault/"
+
+        def call_fn():
+            response = self._session.get(
+                url,
+                headers=self._get_headers(),
+                params={'recursive': 'true'},
+                verify=self.verify_ssl,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.json()
+
+        result = self._safe_call(call_fn)
+        paths = result.get("files", [])
+        # A server that ignores the parameter returns only root entries;
+        # treat that as unsupported so callers fall back to per-folder walks.
+        if not any("/" in p.rstrip("/") for p in paths):
+            raise Exception("Recursive vault listing not supported by server")
+        return paths
+
+    def prime_list_cache(self, listings: dict[str, Any]) -> None:
+        """Seed the request-scoped listing cache with precomputed results.
+
+        Args:
+            listings: Mapping of directory path to a listing response of the
+                same shape list_files_in_directory returns.
+        """
+        self._list_cache.update(listings)
+
+    def clear_request_cache(self) -> None:
+        """Drop memoized listing/content responses.
+
+        Call at the start of a tool invocation when reusing a client across
+        calls, so the cache stays scoped to a single request.
+        """
+        self._list_cache.clear()
+        self._get_cache.clear()
+
+    def cached_list_files_in_directory(self, dirpath: str) -> Any:
+        """Like list_files_in_directory, but memoized per unique path.
+
+        Analyzers frequently re-list the same directory while exploring a
+        vault; this turns duplicate listings into dict lookups.
+        """
+        try:
+            return self._list_cache[dirpath]
+        except KeyError:
+            result = self.list_files_in_dir(dirpath)
+            self._list_cache[dirpath] = result
+            return result
+
+    def cached_get_file_contents(self, filepath: str, return_json: bool = False) -> Any:
+        """Like get_file_contents, but memoized per (path, format) pair."""
+        key = (filepath, return_json)
+        try:
+            return self._get_cache[key]
+        except KeyError:
+            result = self.get_file_contents(filepath, return_json)
+            self._get_cache[key] = result
+            return result
+
     def get_file_contents(self, filepath: str, return_json: bool = False) -> Any:
         url = f"{self.get_base_url()}/vault/{filepath}"
+        key = (filepath, return_json)
 
         def call_fn():
             headers = self._get_headers()
             if return_json:
                 headers['Accept'] = 'application/vnd.olrapi.note+json'
 
-            response = requests.get(url, headers=headers, verify=self.verify_ssl, timeout=self.timeout)
+            cached = self._etag_cache.get(key)
+            if cached is not None:
+                headers['If-None-Match'] = cached[0]
+
+            response = self._session.get(url, headers=headers, verify=self.verify_ssl, timeout=self.timeout)
+            if response.status_code == 304 and cached is not None:
+                return cached[1]
             response.raise_for_status()
 
-            if return_json:
-                return response.json()
-            return response.text
+            result = response.json() if return_json else response.text
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etag_cache[key] = (etag, result)
+            return result
 
         return self._safe_call(call_fn)
     
+    def iter_batch_file_contents(self, filepaths: list[str]):
+        """Iterate over (filepath, content) pairs for multiple files.
+
+        Files that fail to load yield an error message as their content so
+        one bad file doesn't abort the batch.
+
+        Args:
+            filepaths: List of file paths to read
+
+        Yields:
+            Tuples of (filepath, content)
+        """
+        for filepath in filepaths:
+            try:
+                yield filepath, self.get_file_contents(filepath)
+            except Exception as e:
+                yield filepath, f"Error reading file: {str(e)}"
+
     def get_batch_file_contents(self, filepaths: list[str]) -> str:
         """Get contents of multiple files and concatenate them with headers.
-        
+
         Args:
             filepaths: List of file paths to read
-            
+
         Returns:
             String containing all file contents with headers
         """
-        result = []
-        
-        for filepath in filepaths:
-            try:
-                content = self.get_file_contents(filepath)
-                result.append(f"# {filepath}\n\n{content}\n\n---\n\n")
-            except Exception as e:
-                # Add error message but continue processing other files
-                result.append(f"# {filepath}\n\nError reading file: {str(e)}\n\n---\n\n")
-                
-        return "".join(result)
+        return "".join(
+            f"# {filepath}\n\n{content}\n\n---\n\n"
+            for filepath, content in self.iter_batch_file_contents(filepaths)
+        )
 
     def search(self, query: str, context_length: int = 100) -> Any:
         url = f"{self.get_base_url()}/search/simple/"
@@ -117,7 +226,7 @@ class Obsidian():
         }
         
         def call_fn():
-            response = requests.post(url, headers=self._get_headers(), params=params, verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.post(url, headers=self._get_headers(), params=params, verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
 
@@ -127,7 +236,7 @@ class Obsidian():
         url = f"{self.get_base_url()}/vault/{filepath}"
         
         def call_fn():
-            response = requests.post(
+            response = self._session.post(
                 url, 
                 headers=self._get_headers() | {'Content-Type': 'text/markdown'}, 
                 data=content,
@@ -150,7 +259,7 @@ class Obsidian():
         }
         
         def call_fn():
-            response = requests.patch(url, headers=headers, data=content, verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.patch(url, headers=headers, data=content, verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             return None
 
@@ -160,7 +269,7 @@ class Obsidian():
         url = f"{self.get_base_url()}/vault/{filepath}"
         
         def call_fn():
-            response = requests.put(
+            response = self._session.put(
                 url, 
                 headers=self._get_headers() | {'Content-Type': 'text/markdown'}, 
                 data=content,
@@ -184,7 +293,7 @@ class Obsidian():
         url = f"{self.get_base_url()}/vault/{filepath}"
         
         def call_fn():
-            response = requests.delete(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.delete(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             return None
             
@@ -198,7 +307,7 @@ class Obsidian():
         }
         
         def call_fn():
-            response = requests.post(url, headers=headers, json=query, verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.post(url, headers=headers, json=query, verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
 
@@ -222,7 +331,7 @@ class Obsidian():
             headers = self._get_headers()
             if type == "metadata":
                 headers['Accept'] = 'application/vnd.olrapi.note+json'
-            response = requests.get(url, headers=headers, verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.get(url, headers=headers, verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             
             return response.text
@@ -247,7 +356,7 @@ class Obsidian():
         }
         
         def call_fn():
-            response = requests.get(
+            response = self._session.get(
                 url, 
                 headers=self._get_headers(), 
                 params=params,
@@ -260,6 +369,36 @@ class Obsidian():
 
         return self._safe_call(call_fn)
     
+    def get_vault_manifest(self) -> bytes:
+        """Fetch a lightweight manifest of every note's modification time.
+
+        One Dataview DQL query returns path + mtime for the whole vault;
+        callers hash the raw payload to detect whether anything changed
+        since the last index rebuild, without fetching any file contents.
+
+        Returns:
+            Raw response body bytes (stable for an unchanged vault)
+        """
+        dql_query = "TABLE file.mtime\nSORT file.path ASC"
+
+        url = f"{self.get_base_url()}/search/"
+        headers = self._get_headers() | {
+            'Content-Type': 'application/vnd.olrapi.dataview.dql+txt'
+        }
+
+        def call_fn():
+            response = self._session.post(
+                url,
+                headers=headers,
+                data=dql_query.encode('utf-8'),
+                verify=self.verify_ssl,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.content
+
+        return self._safe_call(call_fn)
+
     def get_recent_changes(self, limit: int = 10, days: int = 90) -> Any:
         """Get recently modified files in the vault.
         
@@ -288,7 +427,7 @@ class Obsidian():
         }
         
         def call_fn():
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers=headers,
                 data=dql_query.encode('utf-8'),
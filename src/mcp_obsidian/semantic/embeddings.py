@@ -2,6 +2,7 @@
 Embeddings generation and management for semantic search.
 """
 
+import functools
 import json
 import hashlib
 import logging
@@ -11,9 +12,36 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_model(model_name: str):
+    """Load the sentence transformer model once per process.
+
+    Handlers construct a fresh EmbeddingsManager per tool call; caching
+    here means they all share one model instance instead of paying the
+    tensor init (~1s and ~80 MB) on every call.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "sentence-transformers not installed. "
+            "Install with: pip install sentence-transformers"
+        )
+
+    logger.info(f"Loading sentence transformer model: {model_name}")
+    model = SentenceTransformer(model_name)
+    logger.info("Model loaded successfully")
+    return model
+
+
 class EmbeddingsManager:
     """Manages embedding generation and caching for vault notes."""
 
@@ -43,19 +71,10 @@ class EmbeddingsManager:
 
     @property
     def model(self):
-        """Lazy load the sentence transformer model."""
+        """Lazy load the sentence transformer model (process-wide singleton)."""
         if self._model is None:
             try:
-                from sentence_transformers import SentenceTransformer
-
-                logger.info(f"Loading sentence transformer model: {self.model_name}")
-                self._model = SentenceTransformer(self.model_name)
-                logger.info("Model loaded successfully")
-            except ImportError:
-                raise ImportError(
-                    "sentence-transformers not installed. "
-                    "Install with: pip install sentence-transformers"
-                )
+                self._model = _load_model(self.model_name)
             except Exception as e:
                 logger.error(f"Failed to load model: {e}")
                 raise
@@ -142,18 +161,16 @@ class EmbeddingsManager:
 
         return embedding
 
-    def generate_note_embedding(
-        self, filepath: str, content: str
-    ) -> Dict[str, Any]:
+    def _prepare_note(self, filepath: str, content: str) -> Tuple[str, Dict[str, Any]]:
         """
-        Generate embedding for a note with metadata.
+        Build the text to embed and the cache metadata for a note.
 
         Args:
             filepath: Path to the note
             content: Note content
 
         Returns:
-            Dict with embedding, hash, and metadata
+            Tuple of (contextual_text, metadata dict without embedding)
         """
         # Extract frontmatter and body
         frontmatter, body = self._extract_frontmatter(content)
@@ -178,30 +195,44 @@ class EmbeddingsManager:
         else:
             tags_text = ""
 
-        # Combine for embedding
         contextual_text = f"{title}\n\n{tags_text}\n\n{clean_body}"
 
-        # Generate embedding
-        embedding = self.generate_embedding(contextual_text)
-
-        # Compute content hash
-        content_hash = self._compute_content_hash(content)
-
-        return {
-            "embedding": embedding.tolist(),
-            "hash": content_hash,
+        metadata = {
+            "hash": self._compute_content_hash(content),
             "timestamp": datetime.now().isoformat(),
             "filepath": filepath,
             "title": title,
             "tags": tags if isinstance(tags, list) else [],
         }
 
+        return contextual_text, metadata
+
+    def generate_note_embedding(
+        self, filepath: str, content: str
+    ) -> Dict[str, Any]:
+        """
+        Generate embedding for a note with metadata.
+
+        Args:
+            filepath: Path to the note
+            content: Note content
+
+        Returns:
+            Dict with embedding, hash, and metadata
+        """
+        contextual_text, metadata = self._prepare_note(filepath, content)
+        metadata["embedding"] = self.generate_embedding(contextual_text).tolist()
+        return metadata
+
     def batch_generate_embeddings(
         self, notes: List[Dict[str, str]], show_progress: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Generate embeddings for multiple notes efficiently.
 
+        All texts go through one model.encode call so the transformer runs
+        true batches instead of one forward pass per note.
+
         Args:
             notes: List of dicts with 'filepath' and 'content'
             show_progress: Show progress bar
@@ -209,28 +240,18 @@ class EmbeddingsManager:
         Returns:
             List of embedding dicts
         """
-        results = []
-
-        if show_progress:
-            try:
-                from tqdm import tqdm
+        results: List[Dict[str, Any]] = []
+        prepared: List[Tuple[int, str]] = []  # (index into results, text)
 
-                notes_iter = tqdm(notes, desc="Generating embeddings")
-            except ImportError:
-                notes_iter = notes
-                logger.info(f"Processing {len(notes)} notes...")
-        else:
-            notes_iter = notes
-
-        for note in notes_iter:
+        for note in notes:
             try:
-                result = self.generate_note_embedding(
-                    note["filepath"], note["content"]
-                )
-                results.append(result)
+                text, metadata = self._prepare_note(note["filepath"], note["content"])
+                metadata["embedding"] = None
+                prepared.append((len(results), text))
+                results.append(metadata)
             except Exception as e:
                 logger.error(
-                    f"Failed to generate embedding for {note['filepath']}: {e}"
+                    f"Failed to prepare note {note['filepath']}: {e}"
                 )
                 # Add placeholder for failed note
                 results.append(
@@ -241,6 +262,28 @@ class EmbeddingsManager:
                     }
                 )
 
+        texts = [text for _, text in prepared]
+        if texts:
+            try:
+                vectors = self.model.encode(
+                    texts,
+                    batch_size=64,
+                    show_progress_bar=show_progress,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                )
+                dimension = vectors.shape[1]
+                for (idx, text), vector in zip(prepared, vectors):
+                    if text.strip():
+                        results[idx]["embedding"] = vector.tolist()
+                    else:
+                        # Match generate_embedding's empty-text behavior
+                        results[idx]["embedding"] = np.zeros(dimension).tolist()
+            except Exception as e:
+                logger.error(f"Batch embedding failed: {e}")
+                for idx, _ in prepared:
+                    results[idx]["error"] = str(e)
+
         return results
 
     def load_cache(self) -> Dict[str, Dict[str, Any]]:
@@ -252,13 +295,16 @@ class EmbeddingsManager:
             self._cache = {
                 "model": self.model_name,
                 "dimension": self.model.get_sentence_embedding_dimension(),
+                "normalized": True,
                 "notes": {},
             }
             return self._cache
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # The cache holds every embedding vector and runs to megabytes;
+            # orjson parses it several times faster than stdlib json.
+            raw = self.cache_file.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             # Check if model changed
             if data.get("model") != self.model_name:
@@ -269,6 +315,7 @@ class EmbeddingsManager:
                 self._cache = {
                     "model": self.model_name,
                     "dimension": self.model.get_sentence_embedding_dimension(),
+                    "normalized": True,
                     "notes": {},
                 }
             else:
@@ -282,6 +329,7 @@ class EmbeddingsManager:
             self._cache = {
                 "model": self.model_name,
                 "dimension": self.model.get_sentence_embedding_dimension(),
+                "normalized": True,
                 "notes": {},
             }
             return self._cache
@@ -297,6 +345,7 @@ class EmbeddingsManager:
             self._cache = {
                 "model": self.model_name,
                 "dimension": self.model.get_sentence_embedding_dimension(),
+                "normalized": True,
                 "notes": embeddings,
                 "last_updated": datetime.now().isoformat(),
             }
@@ -306,10 +355,14 @@ class EmbeddingsManager:
             return
 
         try:
-            # Save to temporary file first
+            # Save to temporary file first; compact output — this file is
+            # machine-read only, and indentation would double its size.
             temp_file = self.cache_file.with_suffix(".tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(self._cache, f, indent=2)
+            if orjson is not None:
+                temp_file.write_bytes(orjson.dumps(self._cache))
+            else:
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(self._cache, f)
 
             # Atomic replace
             temp_file.replace(self.cache_file)
@@ -320,6 +373,14 @@ class EmbeddingsManager:
             logger.error(f"Failed to save cache: {e}")
             raise
 
+    def embeddings_are_normalized(self) -> bool:
+        """Whether persisted vectors are unit-length.
+
+        Caches written before the flag existed may hold unnormalized
+        vectors and must be re-normalized before dot-product similarity.
+        """
+        return bool(self.load_cache().get("normalized", False))
+
     def get_cached_embedding(
         self, filepath: str, content_hash: str
     ) -> Optional[np.ndarray]:
@@ -391,6 +452,7 @@ class EmbeddingsManager:
         self._cache = {
             "model": self.model_name,
             "dimension": self.model.get_sentence_embedding_dimension(),
+            "normalized": True,
             "notes": {},
         }
         self.save_cache()
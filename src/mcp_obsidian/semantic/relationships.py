@@ -11,6 +11,66 @@ from .search import SemanticSearchEngine
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _count_edges_per_row(sim, threshold, counts):  # pragma: no cover
+        n = sim.shape[0]
+        for i in prange(n):
+            c = 0
+            for j in range(n):
+                if j != i and sim[i, j] >= threshold:
+                    c += 1
+            counts[i] = c
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fill_edges(sim, threshold, starts, out_j):  # pragma: no cover
+        n = sim.shape[0]
+        for i in prange(n):
+            pos = starts[i]
+            for j in range(n):
+                if j != i and sim[i, j] >= threshold:
+                    out_j[pos] = j
+                    pos += 1
+
+
+def _threshold_edges(sim: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-wise neighbour lists where sim[i, j] >= threshold (i != j).
+
+    With numba installed the scan is jitted and spread across cores via
+    prange (count pass, prefix sum, then a race-free fill into each row's
+    own slice); otherwise a vectorized NumPy pass does the same work.
+
+    Returns:
+        Tuple of (offsets, neighbours): row i's neighbour indices are
+        neighbours[offsets[i]:offsets[i + 1]].
+    """
+    n = len(sim)
+
+    if _HAS_NUMBA:
+        counts = np.empty(n, dtype=np.int64)
+        _count_edges_per_row(sim, threshold, counts)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        neighbours = np.empty(offsets[-1], dtype=np.int64)
+        _fill_edges(sim, threshold, offsets[:-1].copy(), neighbours)
+        return offsets, neighbours
+
+    mask = sim >= threshold
+    np.fill_diagonal(mask, False)
+    rows, cols = np.nonzero(mask)  # Row-major order, matching the jit path
+    counts = np.bincount(rows, minlength=n)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets, cols
+
 
 class RelationshipAnalyzer:
     """Analyze semantic relationships between notes."""
@@ -82,7 +142,43 @@ class RelationshipAnalyzer:
 
         logger.info(f"Analyzing clusters for {len(all_paths)} notes")
 
-        # Get similarity matrix
+        # Preferred path: ANN edge discovery instead of the O(N^2) matrix.
+        edges = self.search_engine.get_knn_edges(
+            filepaths=all_paths, min_similarity=min_similarity
+        )
+        if edges is not None:
+            cluster_info = []
+            for cluster_paths in self._components_from_edges(edges):
+                if len(cluster_paths) < 2:  # Skip singleton clusters
+                    continue
+
+                # Average over the discovered edges, counting each
+                # undirected edge once.
+                edge_similarities = [
+                    similarity
+                    for note in cluster_paths
+                    for other, similarity in edges[note].items()
+                    if note < other
+                ]
+                avg_similarity = (
+                    np.mean(edge_similarities) if edge_similarities else 0.0
+                )
+
+                cluster_info.append(
+                    {
+                        "size": len(cluster_paths),
+                        "notes": cluster_paths,
+                        "avg_similarity": float(avg_similarity),
+                        "theme": self._infer_cluster_theme(cluster_paths),
+                    }
+                )
+
+            cluster_info.sort(key=lambda x: x["size"], reverse=True)
+
+            logger.info(f"Found {len(cluster_info)} clusters")
+            return cluster_info
+
+        # Legacy fallback: full similarity matrix
         similarity_matrix = self.search_engine.get_similarity_matrix(all_paths)
 
         if similarity_matrix.size == 0:
@@ -157,6 +253,42 @@ class RelationshipAnalyzer:
 
         return components
 
+    def _components_from_edges(
+        self, edges: Dict[str, Dict[str, float]]
+    ) -> List[List[str]]:
+        """
+        Find connected components in an adjacency-dict graph.
+
+        Args:
+            edges: Dict mapping filepath to its neighbours
+
+        Returns:
+            List of lists containing filepaths for each component
+        """
+        visited = set()
+        components = []
+
+        for start in edges:
+            if start in visited:
+                continue
+
+            component = []
+            stack = [start]
+            visited.add(start)
+
+            while stack:
+                node = stack.pop()
+                component.append(node)
+
+                for neighbor in edges.get(node, ()):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        stack.append(neighbor)
+
+            components.append(component)
+
+        return components
+
     def _infer_cluster_theme(self, filepaths: List[str]) -> str:
         """
         Infer a theme/topic for a cluster of notes.
@@ -205,21 +337,31 @@ class RelationshipAnalyzer:
         if not all_paths:
             return {}
 
-        # Get similarity matrix
+        # Preferred path: ANN edge discovery instead of the O(N^2) matrix.
+        edges = self.search_engine.get_knn_edges(
+            filepaths=all_paths, min_similarity=min_similarity
+        )
+        if edges is not None:
+            return {
+                filepath: sorted(neighbors)
+                for filepath, neighbors in edges.items()
+            }
+
+        # Legacy fallback: full similarity matrix
         similarity_matrix = self.search_engine.get_similarity_matrix(all_paths)
 
         if similarity_matrix.size == 0:
             return {}
 
-        # Build adjacency list
+        # Build adjacency list from a compiled threshold scan instead of a
+        # Python double loop over the matrix.
+        offsets, neighbours = _threshold_edges(similarity_matrix, min_similarity)
+
         graph = {}
         for i, filepath in enumerate(all_paths):
-            related = []
-            for j, other_path in enumerate(all_paths):
-                if i != j and similarity_matrix[i, j] >= min_similarity:
-                    related.append(other_path)
-
-            graph[filepath] = related
+            graph[filepath] = [
+                all_paths[j] for j in neighbours[offsets[i]:offsets[i + 1]]
+            ]
 
         return graph
 
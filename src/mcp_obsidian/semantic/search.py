@@ -2,9 +2,11 @@
 Semantic search engine using FAISS for similarity search.
 """
 
+import functools
 import json
 import logging
 import re
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
@@ -13,10 +15,91 @@ from .embeddings import EmbeddingsManager
 
 logger = logging.getLogger(__name__)
 
+try:
+    import simsimd
+
+    _HAS_SIMSIMD = True
+except ImportError:
+    _HAS_SIMSIMD = False
+
+
+# Block edge for the tiled pairwise matmul: 256 rows of 384-dim f32 is
+# ~384 KB per operand, comfortably inside L2 on current CPUs.
+_PAIRWISE_BLOCK = 256
+
+
+def _pairwise_cosine(matrix: np.ndarray) -> np.ndarray:
+    """Pairwise cosine similarity over row vectors.
+
+    Uses SimSIMD's SIMD kernels when available (zero-copy over the NumPy
+    buffer); otherwise computes the Gram matrix in cache-sized tiles,
+    exploiting symmetry so each off-diagonal block is one gemm instead of
+    two. Assumes the rows are already L2-normalized.
+    """
+    if _HAS_SIMSIMD:
+        distances = np.asarray(simsimd.cdist(matrix, matrix, metric="cosine"))
+        return 1.0 - distances
+
+    n = len(matrix)
+    if n <= _PAIRWISE_BLOCK:
+        return np.dot(matrix, matrix.T)
+
+    out = np.empty((n, n), dtype=matrix.dtype)
+    for i in range(0, n, _PAIRWISE_BLOCK):
+        block_i = matrix[i:i + _PAIRWISE_BLOCK]
+        out[i:i + len(block_i), i:i + len(block_i)] = block_i @ block_i.T
+        for j in range(i + _PAIRWISE_BLOCK, n, _PAIRWISE_BLOCK):
+            block_j = matrix[j:j + _PAIRWISE_BLOCK]
+            block = block_i @ block_j.T
+            out[i:i + len(block_i), j:j + len(block_j)] = block
+            out[j:j + len(block_j), i:i + len(block_i)] = block.T
+    return out
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, in descending score order.
+
+    argpartition selects the top k in O(n); only those k are then sorted,
+    which beats a full argsort whenever k is much smaller than n.
+    """
+    if k >= len(scores):
+        return np.argsort(-scores)
+    idx = np.argpartition(-scores, k)[:k]
+    return idx[np.argsort(-scores[idx])]
+
+
+# Two queries whose embeddings are at least this similar are treated as
+# the same question and share a cached result list.
+_QUERY_CACHE_THRESHOLD = 0.97
+
+
+@functools.lru_cache(maxsize=1)
+def _torch_device():
+    """Accelerator device for the fused scan path, or None on CPU-only hosts.
+
+    torch ships as a transitive dependency of sentence-transformers, but
+    guard the import anyway so legacy JSON-cache installs keep working.
+    """
+    try:
+        import torch
+    except ImportError:
+        return None
+
+    if torch.cuda.is_available():
+        return torch.device("cuda")
+    if torch.backends.mps.is_available():
+        return torch.device("mps")
+    return None
+
 
 class SemanticSearchEngine:
     """Semantic search engine using FAISS for vector similarity."""
 
+    # Semantic query cache shared across instances, since handlers build a
+    # fresh engine per tool call. Entries are
+    # (params_key, query_text, query_embedding, results).
+    _query_cache: deque = deque(maxlen=256)
+
     def __init__(
         self,
         embeddings_manager: EmbeddingsManager,
@@ -35,9 +118,23 @@ class SemanticSearchEngine:
 
         self.index_file = self.cache_dir / "faiss-index.bin"
         self.metadata_file = self.cache_dir / "index-metadata.json"
+        self.vectors_file = self.cache_dir / "vectors.f32"
+        self.qvectors_file = self.cache_dir / "vectors.i8"
+        self.scales_file = self.cache_dir / "scales.f32"
+        self.pca_file = self.cache_dir / "pca.npz"
+        self.reduced_file = self.cache_dir / "vectors-pca.f32"
+        self.hnsw_file = self.cache_dir / "hnsw-index.bin"
 
         self._index = None
         self._metadata = None
+        self._matrix = None
+        self._qmatrix = None
+        self._scales = None
+        self._reduced = None
+        self._pca_components = None
+        self._pca_mean = None
+        self._hnsw = None
+        self._device_matrix = None
 
         logger.info("SemanticSearchEngine initialized")
 
@@ -85,7 +182,11 @@ class SemanticSearchEngine:
         logger.info(f"Created new FAISS index with dimension {dimension}")
 
     def build_index(
-        self, notes: List[Dict[str, str]], force: bool = False
+        self,
+        notes: List[Dict[str, str]],
+        force: bool = False,
+        manifest_hash: Optional[str] = None,
+        prune_missing: bool = False,
     ) -> Dict[str, Any]:
         """
         Build or rebuild the search index.
@@ -93,6 +194,11 @@ class SemanticSearchEngine:
         Args:
             notes: List of dicts with 'filepath' and 'content'
             force: Force rebuild even if embeddings are cached
+            manifest_hash: Optional vault manifest digest recorded with the
+                index so a later rebuild can be skipped when nothing changed
+            prune_missing: Drop cached embeddings for notes absent from
+                `notes`. Only safe when `notes` covers the whole vault;
+                folder-scoped builds must leave the rest of the cache alone
 
         Returns:
             Dict with build statistics
@@ -101,13 +207,35 @@ class SemanticSearchEngine:
 
         logger.info(f"Building index for {len(notes)} notes (force={force})")
 
-        # Generate embeddings
-        embeddings_data = self.embeddings_manager.batch_generate_embeddings(
-            notes, show_progress=True
+        # Diff against the persisted cache by content hash so an
+        # incremental rebuild only embeds notes that actually changed.
+        # load_cache already discards entries from a different model.
+        cached_notes = self.embeddings_manager.load_cache().get("notes", {})
+        reused: List[Dict[str, Any]] = []
+        to_embed = notes
+        if not force:
+            to_embed = []
+            for note in notes:
+                content_hash = self.embeddings_manager._compute_content_hash(
+                    note["content"]
+                )
+                cached = cached_notes.get(note["filepath"])
+                if cached and cached.get("hash") == content_hash and cached.get("embedding"):
+                    reused.append(cached)
+                else:
+                    to_embed.append(note)
+
+        # Generate embeddings for the changed notes only
+        embeddings_data = (
+            self.embeddings_manager.batch_generate_embeddings(
+                to_embed, show_progress=True
+            )
+            if to_embed
+            else []
         )
 
         # Filter out failed embeddings
-        valid_embeddings = [
+        valid_embeddings = reused + [
             e for e in embeddings_data if e.get("embedding") is not None
         ]
 
@@ -115,13 +243,31 @@ class SemanticSearchEngine:
             logger.error("No valid embeddings generated")
             return {"success": False, "error": "No valid embeddings"}
 
+        # Persist the merged cache so the next incremental rebuild sees
+        # every vector generated here. Merge over the existing entries:
+        # a folder-scoped build only touches a subset of the vault, so
+        # embeddings outside it must survive. Notes deleted from the vault
+        # are pruned only when the caller vouches for full coverage.
+        merged_notes = {
+            **cached_notes,
+            **{e["filepath"]: e for e in valid_embeddings},
+        }
+        if prune_missing:
+            requested = {note["filepath"] for note in notes}
+            merged_notes = {
+                fp: e for fp, e in merged_notes.items() if fp in requested
+            }
+        self.embeddings_manager.save_cache(merged_notes)
+
         # Create embedding matrix
         embeddings_matrix = np.array(
             [e["embedding"] for e in valid_embeddings], dtype=np.float32
         )
 
-        # Normalize for cosine similarity (FAISS uses inner product)
-        faiss.normalize_L2(embeddings_matrix)
+        # The model emits unit vectors, so inner product equals cosine;
+        # only legacy unnormalized caches still need the L2 pass.
+        if not self.embeddings_manager.embeddings_are_normalized():
+            faiss.normalize_L2(embeddings_matrix)
 
         # Create new index
         dimension = embeddings_matrix.shape[1]
@@ -136,11 +282,66 @@ class SemanticSearchEngine:
             "note_paths": [e["filepath"] for e in valid_embeddings],
             "dimension": dimension,
             "model": self.embeddings_manager.model_name,
-            "last_rebuild": embeddings_data[0].get("timestamp")
-            if embeddings_data
-            else None,
+            "last_rebuild": valid_embeddings[0].get("timestamp"),
+            "manifest_sha256": manifest_hash,
         }
 
+        # Persist the vectors as one contiguous float32 file so later
+        # processes can memory-map them instead of re-parsing JSON.
+        mm = np.memmap(
+            self.vectors_file,
+            dtype=np.float32,
+            mode="w+",
+            shape=embeddings_matrix.shape,
+        )
+        mm[:] = embeddings_matrix
+        mm.flush()
+        self._matrix = None  # Reopen lazily against the new file
+
+        # int8 sidecar with per-vector scales: coarse similarity scans read
+        # a quarter of the bytes, and the f32 file above stays around as
+        # the shadow used to re-rank the shortlisted candidates.
+        scales = np.max(np.abs(embeddings_matrix), axis=1)
+        scales[scales == 0] = 1.0  # Zero vectors quantize to zero anyway
+        scales = (127.0 / scales).astype(np.float32)
+        quantized = np.clip(
+            np.round(embeddings_matrix * scales[:, None]), -127, 127
+        ).astype(np.int8)
+        quantized.tofile(self.qvectors_file)
+        scales.tofile(self.scales_file)
+        self._qmatrix = None
+        self._scales = None
+
+        # PCA sidecar: a 128-dim projection traverses a third of the bytes
+        # during coarse scans. Fitted with an economy SVD so no extra
+        # dependency is needed; the full-precision re-rank bounds the
+        # recall loss.
+        n_components = 128
+        if embeddings_matrix.shape[0] > n_components:
+            pca_mean = embeddings_matrix.mean(axis=0)
+            centered = embeddings_matrix - pca_mean
+            _, _, vt = np.linalg.svd(centered, full_matrices=False)
+            components = vt[:n_components].astype(np.float32)
+            reduced = (centered @ components.T).astype(np.float32)
+            np.savez(self.pca_file, components=components, mean=pca_mean)
+            reduced.tofile(self.reduced_file)
+        else:
+            # Tiny vaults: projection overhead outweighs the scan savings.
+            self.pca_file.unlink(missing_ok=True)
+            self.reduced_file.unlink(missing_ok=True)
+        self._reduced = None
+        self._pca_components = None
+        self._pca_mean = None
+
+        # Row order changed, so the persisted HNSW graph and the on-device
+        # matrix copy are both stale.
+        self._hnsw = None
+        self.hnsw_file.unlink(missing_ok=True)
+        self._device_matrix = None
+
+        # Cached query results may reference notes that just changed.
+        self._query_cache.clear()
+
         # Save index and metadata
         self._save_index()
 
@@ -149,7 +350,9 @@ class SemanticSearchEngine:
         return {
             "success": True,
             "total_notes": len(valid_embeddings),
-            "failed": len(embeddings_data) - len(valid_embeddings),
+            "reused_from_cache": len(reused),
+            "embedded": len(to_embed),
+            "failed": len(to_embed) - (len(valid_embeddings) - len(reused)),
         }
 
     def _save_index(self):
@@ -195,14 +398,96 @@ class SemanticSearchEngine:
             logger.warning("Index is empty. Build index first.")
             return []
 
-        # Generate query embedding
+        cache_key = (top_k, min_similarity, folder, include_content)
+
+        # Exact repeats skip the encode() forward pass entirely. Iterate a
+        # snapshot: the engine is a process-wide singleton and concurrent
+        # searches append to the deque, which would otherwise raise
+        # "deque mutated during iteration".
+        for key, cached_query, _, cached_results in tuple(self._query_cache):
+            if key == cache_key and cached_query == query:
+                return [dict(r, cache_hit=True) for r in cached_results]
+
+        # Generate query embedding; the model already normalizes it, so the
+        # index inner product is directly the cosine similarity.
         query_embedding = self.embeddings_manager.generate_embedding(query)
         query_embedding = query_embedding.reshape(1, -1).astype(np.float32)
 
-        # Normalize for cosine similarity
-        import faiss
-
-        faiss.normalize_L2(query_embedding)
+        # Near-identical phrasings reuse the cached result list instead of
+        # re-running the scan; embeddings are unit vectors, so the dot
+        # product is the cosine similarity. Snapshot again for the same
+        # reason as above — the deque may have grown during encode().
+        for key, _, cached_embedding, cached_results in tuple(self._query_cache):
+            if key != cache_key:
+                continue
+            if float(np.dot(cached_embedding, query_embedding[0])) >= _QUERY_CACHE_THRESHOLD:
+                return [dict(r, cache_hit=True) for r in cached_results]
+
+        # Folder-filtered queries score only that folder's rows against the
+        # mmap'd matrix and select with argpartition, instead of over-fetching
+        # from FAISS and hoping enough survivors remain after filtering.
+        if folder:
+            matrix = self.get_matrix()
+            if matrix is not None:
+                note_paths = self._metadata["note_paths"]
+                rows = [i for i, p in enumerate(note_paths) if p.startswith(folder)]
+                if not rows:
+                    return []
+
+                results = []
+                for row, similarity in self._top_rows(
+                    rows, query_embedding[0], top_k
+                ):
+                    if similarity < min_similarity:
+                        break  # Scores are descending: nothing later passes
+
+                    filepath = note_paths[row]
+                    result = {
+                        "filepath": filepath,
+                        "similarity": similarity,
+                        "title": Path(filepath).stem,
+                    }
+
+                    if include_content:
+                        result["snippet"] = self._generate_snippet(filepath, query)
+
+                    results.append(result)
+
+                self._query_cache.append(
+                    (cache_key, query, query_embedding[0], results)
+                )
+                return results
+
+        # On CUDA/MPS hosts the unfiltered scan runs entirely on-device:
+        # one small query upload, matmul + topk on the accelerator, and
+        # only the k winning rows copied back to the host.
+        if not folder:
+            device_matrix = self._get_device_matrix()
+            if device_matrix is not None:
+                note_paths = self._metadata["note_paths"]
+                results = []
+                for row, similarity in self._device_top_k(
+                    device_matrix, query_embedding[0], top_k
+                ):
+                    if similarity < min_similarity:
+                        break  # Scores are descending: nothing later passes
+
+                    filepath = note_paths[row]
+                    result = {
+                        "filepath": filepath,
+                        "similarity": similarity,
+                        "title": Path(filepath).stem,
+                    }
+
+                    if include_content:
+                        result["snippet"] = self._generate_snippet(filepath, query)
+
+                    results.append(result)
+
+                self._query_cache.append(
+                    (cache_key, query, query_embedding[0], results)
+                )
+                return results
 
         # Search
         # Request more results if we need to filter by folder
@@ -239,6 +524,7 @@ class SemanticSearchEngine:
             if len(results) >= top_k:
                 break
 
+        self._query_cache.append((cache_key, query, query_embedding[0], results))
         return results
 
     def search_by_note(
@@ -290,13 +576,14 @@ class SemanticSearchEngine:
         if self._metadata is None or self._metadata.get("total_notes", 0) == 0:
             return []
 
-        # Prepare embedding
+        # Prepare embedding; cached vectors may predate the normalized
+        # cache format, so guard the L2 pass on the flag.
         query_embedding = embedding.reshape(1, -1).astype(np.float32)
 
-        # Normalize
-        import faiss
+        if not self.embeddings_manager.embeddings_are_normalized():
+            import faiss
 
-        faiss.normalize_L2(query_embedding)
+            faiss.normalize_L2(query_embedding)
 
         # Search (request extra if we're excluding)
         search_k = top_k + 1 if exclude else top_k
@@ -363,6 +650,288 @@ class SemanticSearchEngine:
             logger.error(f"Failed to generate snippet for {filepath}: {e}")
             return ""
 
+    def get_matrix(self) -> Optional[np.ndarray]:
+        """
+        Memory-map the persisted (N, D) float32 embedding matrix.
+
+        Opened once per process and reused; rows align with the
+        note_paths list in the index metadata. Returns None when no
+        vectors file has been written yet (pre-upgrade caches).
+        """
+        if self._matrix is not None:
+            return self._matrix
+
+        _ = self.index  # Ensure metadata is loaded
+        if not self.vectors_file.exists():
+            return None
+
+        total = self._metadata.get("total_notes", 0)
+        dimension = self._metadata.get("dimension")
+        if not total or not dimension:
+            return None
+
+        self._matrix = np.memmap(
+            self.vectors_file,
+            dtype=np.float32,
+            mode="r",
+            shape=(total, dimension),
+        )
+        return self._matrix
+
+    def get_quantized_matrix(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Memory-map the int8 vectors and their per-vector scales.
+
+        Vectors are stored as round(v * scale) with scale = 127 / max|v|,
+        so a row dequantizes as v_i8 / scale. Returns None when the
+        sidecar files have not been written yet (pre-upgrade caches).
+        """
+        if self._qmatrix is not None:
+            return self._qmatrix, self._scales
+
+        _ = self.index  # Ensure metadata is loaded
+        if not (self.qvectors_file.exists() and self.scales_file.exists()):
+            return None
+
+        total = self._metadata.get("total_notes", 0)
+        dimension = self._metadata.get("dimension")
+        if not total or not dimension:
+            return None
+
+        self._qmatrix = np.memmap(
+            self.qvectors_file,
+            dtype=np.int8,
+            mode="r",
+            shape=(total, dimension),
+        )
+        self._scales = np.memmap(
+            self.scales_file,
+            dtype=np.float32,
+            mode="r",
+            shape=(total,),
+        )
+        return self._qmatrix, self._scales
+
+    def get_reduced_matrix(self) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Memory-map the PCA-reduced matrix and its projection.
+
+        Returns:
+            Tuple of (reduced_matrix, components, mean) — a query projects
+            as components @ (q - mean) — or None when the sidecar has not
+            been written (pre-upgrade caches or tiny vaults).
+        """
+        if self._reduced is not None:
+            return self._reduced, self._pca_components, self._pca_mean
+
+        _ = self.index  # Ensure metadata is loaded
+        if not (self.pca_file.exists() and self.reduced_file.exists()):
+            return None
+
+        total = self._metadata.get("total_notes", 0)
+        if not total:
+            return None
+
+        with np.load(self.pca_file) as data:
+            self._pca_components = data["components"].astype(np.float32)
+            self._pca_mean = data["mean"].astype(np.float32)
+
+        self._reduced = np.memmap(
+            self.reduced_file,
+            dtype=np.float32,
+            mode="r",
+            shape=(total, self._pca_components.shape[0]),
+        )
+        return self._reduced, self._pca_components, self._pca_mean
+
+    def _top_rows(
+        self, rows: List[int], query: np.ndarray, top_k: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Top-k (row, similarity) pairs for a query over the given rows.
+
+        When a compact sidecar exists (PCA-reduced or int8 rows), a
+        coarse scan over it shortlists ~100 candidates; only those are
+        re-ranked against the f32 shadow, so just a handful of f32 pages
+        are ever touched.
+
+        Args:
+            rows: Row indices into the embedding matrix
+            query: Normalized query vector
+            top_k: Number of results
+
+        Returns:
+            List of (row, similarity) in descending similarity order
+        """
+        matrix = self.get_matrix()
+        shortlist_size = max(top_k, 100)
+
+        if len(rows) > shortlist_size:
+            # Coarse pass over the cheapest representation available:
+            # PCA-reduced rows (a third of the bytes), else int8 rows
+            # (a quarter), else nothing — the f32 re-rank below bounds
+            # the approximation error either way.
+            reduced = self.get_reduced_matrix()
+            quantized = self.get_quantized_matrix()
+            if reduced is not None:
+                reduced_matrix, components, mean = reduced
+                reduced_query = components @ (query - mean)
+                coarse = np.asarray(reduced_matrix[rows]) @ reduced_query
+                shortlist = _top_k_indices(coarse, shortlist_size)
+                rows = [rows[i] for i in shortlist]
+            elif quantized is not None:
+                qmatrix, scales = quantized
+                coarse = (
+                    np.asarray(qmatrix[rows], dtype=np.float32) @ query
+                ) / np.asarray(scales[rows])
+                shortlist = _top_k_indices(coarse, shortlist_size)
+                rows = [rows[i] for i in shortlist]
+
+        scores = np.asarray(matrix[rows], dtype=np.float32) @ query
+        order = _top_k_indices(scores, top_k)
+        return [(rows[i], float(scores[i])) for i in order]
+
+    def _get_device_matrix(self):
+        """Embedding matrix resident on the CUDA/MPS device, or None.
+
+        Uploaded once per process, so subsequent queries scan at device
+        memory bandwidth instead of re-crossing the host-device bus with
+        the whole matrix each time.
+        """
+        device = _torch_device()
+        if device is None:
+            return None
+
+        if self._device_matrix is not None:
+            return self._device_matrix
+
+        matrix = self.get_matrix()
+        if matrix is None:
+            return None
+
+        import torch
+
+        self._device_matrix = torch.from_numpy(
+            np.ascontiguousarray(matrix)
+        ).to(device)
+        return self._device_matrix
+
+    def _device_top_k(
+        self, device_matrix, query: np.ndarray, top_k: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Top-k (row, similarity) pairs via on-device matmul + topk.
+
+        Only the query vector goes up and only the k winners come back;
+        the scan itself never touches host memory.
+
+        Args:
+            device_matrix: Torch tensor returned by _get_device_matrix
+            query: Normalized query vector
+            top_k: Number of results
+
+        Returns:
+            List of (row, similarity) in descending similarity order
+        """
+        import torch
+
+        q = torch.from_numpy(query).to(device_matrix.device)
+        scores = device_matrix @ q
+        values, indices = torch.topk(scores, min(top_k, len(scores)))
+        return list(zip(indices.cpu().tolist(), values.cpu().tolist()))
+
+    def _load_or_build_hnsw(self, matrix: np.ndarray):
+        """Load the persisted HNSW graph, rebuilding when rows changed."""
+        import faiss
+
+        if self._hnsw is not None and self._hnsw.ntotal == len(matrix):
+            return self._hnsw
+
+        if self.hnsw_file.exists():
+            try:
+                hnsw = faiss.read_index(str(self.hnsw_file))
+                if hnsw.ntotal == len(matrix) and hnsw.d == matrix.shape[1]:
+                    hnsw.hnsw.efSearch = 64
+                    self._hnsw = hnsw
+                    return hnsw
+            except Exception as e:
+                logger.warning(f"Failed to load HNSW index: {e}. Rebuilding.")
+
+        hnsw = faiss.IndexHNSWFlat(matrix.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+        hnsw.hnsw.efSearch = 64
+        hnsw.add(np.ascontiguousarray(matrix, dtype=np.float32))
+
+        try:
+            faiss.write_index(hnsw, str(self.hnsw_file))
+        except Exception as e:
+            logger.warning(f"Failed to persist HNSW index: {e}")
+
+        self._hnsw = hnsw
+        return hnsw
+
+    def get_knn_edges(
+        self,
+        filepaths: Optional[List[str]] = None,
+        k: int = 32,
+        min_similarity: float = 0.7,
+    ) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Approximate nearest-neighbour edges above a similarity threshold.
+
+        Queries an HNSW graph (persisted next to the vectors file) once per
+        requested note instead of materializing the full N x N similarity
+        matrix, so connection discovery scales roughly O(N log N) and memory
+        stays bounded by the surviving edges. Neighbour lists are capped at
+        k, so extremely dense nodes may miss edges beyond the cap.
+
+        Args:
+            filepaths: Optional subset of notes; defaults to the whole index
+            k: Neighbours to request per note before thresholding
+            min_similarity: Minimum similarity for an edge to survive
+
+        Returns:
+            Dict mapping filepath to {neighbour_filepath: similarity},
+            mirrored so the graph is undirected. None when no vectors
+            matrix is available (legacy caches).
+        """
+        matrix = self.get_matrix()
+        if matrix is None:
+            return None
+
+        note_paths = self._metadata.get("note_paths", [])
+        if filepaths is None:
+            filepaths = note_paths
+
+        row_of = {fp: i for i, fp in enumerate(note_paths)}
+        rows = [row_of[fp] for fp in filepaths if fp in row_of]
+        if not rows:
+            return {}
+
+        hnsw = self._load_or_build_hnsw(matrix)
+        wanted = set(rows)
+
+        queries = np.ascontiguousarray(matrix[rows], dtype=np.float32)
+        search_k = min(k + 1, hnsw.ntotal)  # +1: each query returns itself
+        similarities, indices = hnsw.search(queries, search_k)
+
+        edges: Dict[str, Dict[str, float]] = {note_paths[r]: {} for r in rows}
+        for row, sims, idxs in zip(rows, similarities, indices):
+            filepath = note_paths[row]
+            for idx, similarity in zip(idxs, sims):
+                if idx == -1 or idx == row or idx not in wanted:
+                    continue
+                if similarity < min_similarity:
+                    continue
+                edges[filepath][note_paths[idx]] = float(similarity)
+
+        # HNSW neighbour lists are not symmetric; mirror every edge so
+        # component discovery sees an undirected graph.
+        for filepath, neighbors in list(edges.items()):
+            for other, similarity in neighbors.items():
+                edges[other].setdefault(filepath, similarity)
+
+        return edges
+
     def get_all_embeddings(self) -> Dict[str, np.ndarray]:
         """
         Get all embeddings from the index.
@@ -373,6 +942,15 @@ class SemanticSearchEngine:
         if self._metadata is None:
             return {}
 
+        # Preferred path: rows of the mmap'd matrix, no JSON parsing.
+        matrix = self.get_matrix()
+        if matrix is not None:
+            return {
+                filepath: matrix[i]
+                for i, filepath in enumerate(self._metadata.get("note_paths", []))
+            }
+
+        # Legacy fallback: per-note vectors from the JSON cache.
         cache = self.embeddings_manager.load_cache()
         notes_cache = cache.get("notes", {})
 
@@ -401,7 +979,23 @@ class SemanticSearchEngine:
         if not filepaths:
             return np.array([])
 
-        # Get embeddings
+        # Preferred path: slice rows straight out of the mmap'd matrix.
+        matrix = self.get_matrix()
+        if matrix is not None:
+            note_paths = self._metadata.get("note_paths", [])
+            row_of = {fp: i for i, fp in enumerate(note_paths)}
+            rows = [row_of[fp] for fp in filepaths if fp in row_of]
+            if not rows:
+                return np.array([])
+            # Persisted vectors are written post-normalization, so the
+            # similarity is a straight dot product.
+            if len(rows) == len(note_paths):
+                embeddings_matrix = np.ascontiguousarray(matrix)
+            else:
+                embeddings_matrix = np.ascontiguousarray(matrix[rows])
+            return _pairwise_cosine(embeddings_matrix)
+
+        # Legacy fallback: gather vectors from the JSON cache.
         embeddings_dict = self.get_all_embeddings()
         embeddings_list = [
             embeddings_dict[fp] for fp in filepaths if fp in embeddings_dict
@@ -412,16 +1006,22 @@ class SemanticSearchEngine:
 
         embeddings_matrix = np.array(embeddings_list, dtype=np.float32)
 
-        # Normalize
-        import faiss
+        # Normalize only when the cache predates unit-vector persistence
+        if not self.embeddings_manager.embeddings_are_normalized():
+            import faiss
 
-        faiss.normalize_L2(embeddings_matrix)
+            faiss.normalize_L2(embeddings_matrix)
 
-        # Compute cosine similarity (inner product of normalized vectors)
-        similarity_matrix = np.dot(embeddings_matrix, embeddings_matrix.T)
+        # Cosine similarity via SIMD kernels (or BLAS on the normalized rows)
+        similarity_matrix = _pairwise_cosine(embeddings_matrix)
 
         return similarity_matrix
 
+    def get_manifest_hash(self) -> Optional[str]:
+        """Vault manifest digest the index was last built from, if any."""
+        _ = self.index  # Ensure metadata is loaded
+        return (self._metadata or {}).get("manifest_sha256")
+
     def get_index_stats(self) -> Dict[str, Any]:
         """Get statistics about the search index."""
         if self._metadata is None:
@@ -3,7 +3,6 @@ import logging
 from collections.abc import Sequence
 from functools import lru_cache
 from typing import Any
-import os
 import warnings
 from dotenv import load_dotenv
 from mcp.server import Server
@@ -28,10 +27,8 @@ from . import tools
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mcp-obsidian")
 
-api_key = os.getenv("OBSIDIAN_API_KEY")
-if not api_key:
-    raise ValueError(f"OBSIDIAN_API_KEY environment variable required. Working directory: {os.getcwd()}")
-
+# OBSIDIAN_API_KEY is validated lazily in tools._config() on first tool
+# use, so a missing key no longer aborts import of the package.
 app = Server("mcp-obsidian")
 
 tool_handlers = {}
@@ -1,70 +1,277 @@
 from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Callable
 from mcp.types import (
     Tool,
     TextContent,
     ImageContent,
     EmbeddedResource,
 )
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
+from datetime import datetime
+from types import GeneratorType
 from . import obsidian
+from .analyzers.frontmatter import FrontmatterAnalyzer
+from .analyzers.structure import VaultStructureAnalyzer
+from .config import get_config_manager
+from .knowledge.daily import DailyNotesManager
+from .knowledge.people import PeopleManager
+from .knowledge.projects import ProjectsManager
 
 logger = logging.getLogger(__name__)
 
-api_key = os.getenv("OBSIDIAN_API_KEY", "")
-obsidian_host = os.getenv("OBSIDIAN_HOST", "127.0.0.1")
 
-if api_key == "":
-    raise ValueError(f"OBSIDIAN_API_KEY environment variable required. Working directory: {os.getcwd()}")
+@functools.cache
+def _config() -> tuple[str, str]:
+    """Read and validate Obsidian connection settings once per process."""
+    api_key = os.getenv("OBSIDIAN_API_KEY", "")
+    if api_key == "":
+        raise ValueError(f"OBSIDIAN_API_KEY environment variable required. Working directory: {os.getcwd()}")
+    return api_key, os.getenv("OBSIDIAN_HOST", "127.0.0.1")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_api() -> obsidian.Obsidian:
+    """Get the process-wide Obsidian API client.
+
+    A single client keeps the underlying HTTP connections warm across tool
+    invocations; callers that rely on its request-scoped caches must call
+    clear_request_cache() before use.
+    """
+    api_key, obsidian_host = _config()
+    return obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+
+
+@functools.lru_cache(maxsize=1)
+def _structure_analyzer() -> VaultStructureAnalyzer:
+    """Get the process-wide vault structure analyzer."""
+    return VaultStructureAnalyzer(_get_api())
+
+
+@functools.lru_cache(maxsize=1)
+def _frontmatter_analyzer() -> FrontmatterAnalyzer:
+    """Get the process-wide frontmatter analyzer."""
+    return FrontmatterAnalyzer(_get_api())
+
+
+# The semantic stack is built lazily (heavy ML imports) but shared once
+# built: one engine means the index metadata, the mmap'd embedding matrix
+# and the path->row mapping are loaded once per process instead of once
+# per tool call.
+
+@functools.lru_cache(maxsize=1)
+def _search_engine():
+    """Get the process-wide semantic search engine."""
+    from .semantic import EmbeddingsManager, SemanticSearchEngine
+
+    return SemanticSearchEngine(EmbeddingsManager())
+
+
+@functools.lru_cache(maxsize=1)
+def _relationship_analyzer():
+    """Get the process-wide relationship analyzer."""
+    from .semantic import RelationshipAnalyzer
+
+    return RelationshipAnalyzer(_search_engine())
+
+
+@functools.lru_cache(maxsize=1)
+def _link_engine():
+    """Get the process-wide link suggestion engine."""
+    from .semantic import LinkSuggestionEngine
+
+    return LinkSuggestionEngine(_relationship_analyzer())
 
 TOOL_LIST_FILES_IN_VAULT = "obsidian_list_files_in_vault"
 TOOL_LIST_FILES_IN_DIR = "obsidian_list_files_in_dir"
 
+# Lightweight frontmatter scanning: enough to list field names without a
+# full YAML parse.
+_FRONTMATTER_BLOCK_RE = re.compile(r"\A---\n(.*?)\n---", re.DOTALL)
+_FRONTMATTER_FIELD_RE = re.compile(r"^([A-Za-z_][\w-]*)\s*:", re.MULTILINE)
+
+_VALID_PERIODS = frozenset(("daily", "weekly", "monthly", "quarterly", "yearly"))
+_VALID_PERIODS_MSG = "daily, weekly, monthly, quarterly, yearly"
+_VALID_TYPES = frozenset(("content", "metadata"))
+_VALID_TYPES_MSG = "content, metadata"
+
 class ToolHandler():
+    # Argument names that must be present in args; checked with a single
+    # set difference instead of one membership test per key.
+    REQUIRED: frozenset = frozenset()
+
+    # Structured payload of the most recent run_tool call. In-process
+    # callers (the test harness, embedded clients) read this instead of
+    # re-parsing the serialized TextContent; MCP clients still get JSON.
+    _last_result = None
+
     def __init__(self, tool_name: str):
         self.name = tool_name
 
+    def _check_required(self, args: dict) -> None:
+        missing = self.REQUIRED - args.keys()
+        if missing:
+            raise RuntimeError(f"missing args: {', '.join(sorted(missing))}")
+
+    def _respond(self, payload, pretty: bool = False) -> Sequence[TextContent]:
+        """Record the structured payload and return it serialized for MCP."""
+        self._last_result = payload
+        return [TextContent(type="text", text=_dumps(payload, pretty))]
+
     def get_tool_description(self) -> Tool:
         raise NotImplementedError()
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         raise NotImplementedError()
-    
-class ListFilesInVaultToolHandler(ToolHandler):
+
+
+@dataclass(slots=True, frozen=True)
+class ToolSpec:
+    """Declarative description of a tool whose run_tool is pure dispatch.
+
+    Handlers that only validate arguments, call one Obsidian API method and
+    format the result can be expressed as a spec instead of hand-written
+    boilerplate. Dispatch then happens in a single shared code path.
+    """
+
+    name: str
+    tool: Tool
+    required_args: frozenset
+    api_method_name: str
+    arg_names: tuple
+    response_formatter: Callable
+
+
+# Response bodies must stay str: mcp.types.TextContent validates text as a
+# string (it has no bytes-capable variant, and subclassing would break the
+# SDK's serializer), so pre-encoding to bytes here would only force an
+# extra decode. UTF-8 encoding happens exactly once, in the MCP transport
+# layer; the compact default in _dumps keeps that pass small.
+try:
+    import orjson
+
+    def _dumps(obj, pretty: bool = False) -> str:
+        """Serialize to JSON text via orjson's C encoder.
+
+        Compact by default; indentation roughly doubles the payload for
+        large analyses, so it is opt-in.
+        """
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+except ImportError:
+    def _dumps(obj, pretty: bool = False) -> str:
+        """Serialize to JSON text (stdlib fallback), compact by default."""
+        return json.dumps(obj, indent=2 if pretty else None)
+
+
+def _format_json(result, args) -> str:
+    return _dumps(result)
+
+
+def _format_raw(result, args) -> str:
+    return result
+
+
+def _format_text_or_json(result, args) -> str:
+    # File reads return raw markdown as str; wrapping that in json.dumps
+    # would just escape the whole body. Only non-string payloads (e.g. the
+    # JSON note representation) need serializing.
+    return result if isinstance(result, str) else _dumps(result)
+
+
+def _format_batch_contents(result, args) -> str:
+    # str.join pre-sizes the final buffer, so the payload is built in one pass.
+    return "".join(
+        f"# {filepath}\n\n{content}\n\n---\n\n" for filepath, content in result
+    )
+
+
+def _format_search_results(results, args) -> str:
+    formatted_results = []
+    for result in results:
+        formatted_matches = []
+        for match in result.get('matches', []):
+            context = match.get('context', '')
+            match_pos = match.get('match', {})
+            start = match_pos.get('start', 0)
+            end = match_pos.get('end', 0)
+
+            formatted_matches.append({
+                'context': context,
+                'match_position': {'start': start, 'end': end}
+            })
+
+        formatted_results.append({
+            'filename': result.get('filename', ''),
+            'score': result.get('score', 0),
+            'matches': formatted_matches
+        })
+
+    return _dumps(formatted_results)
+
+
+class SpecToolHandler(ToolHandler):
+    """Tool handler driven entirely by a class-level ToolSpec."""
+
+    spec: ToolSpec
+
     def __init__(self):
-        super().__init__(TOOL_LIST_FILES_IN_VAULT)
+        super().__init__(self.spec.name)
+        self.REQUIRED = self.spec.required_args
 
-    def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Lists all files and directories in the root directory of your Obsidian vault.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
-        )
+    def get_tool_description(self) -> Tool:
+        return self.spec.tool
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        spec = self.spec
+        self._check_required(args)
 
-        files = api.list_files_in_vault()
+        api = _get_api()
+        result = getattr(api, spec.api_method_name)(
+            *(args[name] for name in spec.arg_names)
+        )
+        if isinstance(result, GeneratorType):
+            # Streaming results (iter_batch_file_contents) would leave
+            # _last_result as a spent generator once the formatter ran;
+            # materialize them so the recorded payload stays readable.
+            result = list(result)
+        self._last_result = result
 
         return [
             TextContent(
                 type="text",
-                text=json.dumps(files, indent=2)
+                text=spec.response_formatter(result, args)
             )
         ]
-    
-class ListFilesInDirToolHandler(ToolHandler):
-    def __init__(self):
-        super().__init__(TOOL_LIST_FILES_IN_DIR)
 
-    def get_tool_description(self):
-        return Tool(
-            name=self.name,
+
+class ListFilesInVaultToolHandler(SpecToolHandler):
+    spec = ToolSpec(
+        name=TOOL_LIST_FILES_IN_VAULT,
+        tool=Tool(
+            name=TOOL_LIST_FILES_IN_VAULT,
+            description="Lists all files and directories in the root directory of your Obsidian vault.",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            },
+        ),
+        required_args=frozenset(),
+        api_method_name="list_files_in_vault",
+        arg_names=(),
+        response_formatter=_format_json,
+    )
+
+class ListFilesInDirToolHandler(SpecToolHandler):
+    spec = ToolSpec(
+        name=TOOL_LIST_FILES_IN_DIR,
+        tool=Tool(
+            name=TOOL_LIST_FILES_IN_DIR,
             description="Lists all files and directories that exist in a specific Obsidian directory.",
             inputSchema={
                 "type": "object",
@@ -76,31 +283,18 @@ class ListFilesInDirToolHandler(ToolHandler):
                 },
                 "required": ["dirpath"]
             }
-        )
-
-    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-
-        if "dirpath" not in args:
-            raise RuntimeError("dirpath argument missing in arguments")
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-
-        files = api.list_files_in_dir(args["dirpath"])
-
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(files, indent=2)
-            )
-        ]
-    
-class GetFileContentsToolHandler(ToolHandler):
-    def __init__(self):
-        super().__init__("obsidian_get_file_contents")
-
-    def get_tool_description(self):
-        return Tool(
-            name=self.name,
+        ),
+        required_args=frozenset(("dirpath",)),
+        api_method_name="list_files_in_dir",
+        arg_names=("dirpath",),
+        response_formatter=_format_json,
+    )
+
+class GetFileContentsToolHandler(SpecToolHandler):
+    spec = ToolSpec(
+        name="obsidian_get_file_contents",
+        tool=Tool(
+            name="obsidian_get_file_contents",
             description="Return the content of a single file in your vault.",
             inputSchema={
                 "type": "object",
@@ -113,31 +307,23 @@ class GetFileContentsToolHandler(ToolHandler):
                 },
                 "required": ["filepath"]
             }
-        )
+        ),
+        required_args=frozenset(("filepath",)),
+        api_method_name="get_file_contents",
+        arg_names=("filepath",),
+        response_formatter=_format_text_or_json,
+    )
 
-    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "filepath" not in args:
-            raise RuntimeError("filepath argument missing in arguments")
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-
-        content = api.get_file_contents(args["filepath"])
-
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(content, indent=2)
-            )
-        ]
-    
 class SearchToolHandler(ToolHandler):
+    REQUIRED = frozenset(("query",))
+
     def __init__(self):
         super().__init__("obsidian_simple_search")
 
     def get_tool_description(self):
         return Tool(
             name=self.name,
-            description="""Simple search for documents matching a specified text query across all files in the vault. 
+            description="""Simple search for documents matching a specified text query across all files in the vault.
             Use this tool when you want to do a simple text search""",
             inputSchema={
                 "type": "object",
@@ -157,41 +343,20 @@ class SearchToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "query" not in args:
-            raise RuntimeError("query argument missing in arguments")
+        self._check_required(args)
 
         context_length = args.get("context_length", 100)
-        
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+
+        api = _get_api()
         results = api.search(args["query"], context_length)
-        
-        formatted_results = []
-        for result in results:
-            formatted_matches = []
-            for match in result.get('matches', []):
-                context = match.get('context', '')
-                match_pos = match.get('match', {})
-                start = match_pos.get('start', 0)
-                end = match_pos.get('end', 0)
-                
-                formatted_matches.append({
-                    'context': context,
-                    'match_position': {'start': start, 'end': end}
-                })
-                
-            formatted_results.append({
-                'filename': result.get('filename', ''),
-                'score': result.get('score', 0),
-                'matches': formatted_matches
-            })
 
         return [
             TextContent(
                 type="text",
-                text=json.dumps(formatted_results, indent=2)
+                text=_format_search_results(results, args)
             )
         ]
-    
+
 class AppendContentToolHandler(ToolHandler):
    def __init__(self):
        super().__init__("obsidian_append_content")
@@ -218,20 +383,24 @@ class AppendContentToolHandler(ToolHandler):
        )
 
    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if "filepath" not in args or "content" not in args:
+       filepath = args.get("filepath")
+       content = args.get("content")
+       if not filepath or content is None:
            raise RuntimeError("filepath and content arguments required")
 
-       api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-       api.append_content(args.get("filepath", ""), args["content"])
+       api = _get_api()
+       api.append_content(filepath, content)
 
        return [
            TextContent(
                type="text",
-               text=f"Successfully appended content to {args['filepath']}"
+               text=f"Successfully appended content to {filepath}"
            )
        ]
    
 class PatchContentToolHandler(ToolHandler):
+   REQUIRED = frozenset(("filepath", "operation", "target_type", "target", "content"))
+
    def __init__(self):
        super().__init__("obsidian_patch_content")
 
@@ -271,22 +440,23 @@ class PatchContentToolHandler(ToolHandler):
        )
 
    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if not all(k in args for k in ["filepath", "operation", "target_type", "target", "content"]):
-           raise RuntimeError("filepath, operation, target_type, target and content arguments required")
+       self._check_required(args)
+
+       filepath = args["filepath"]
 
-       api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+       api = _get_api()
        api.patch_content(
-           args.get("filepath", ""),
-           args.get("operation", ""),
-           args.get("target_type", ""),
-           args.get("target", ""),
-           args.get("content", "")
+           filepath,
+           args["operation"],
+           args["target_type"],
+           args["target"],
+           args["content"]
        )
 
        return [
            TextContent(
                type="text",
-               text=f"Successfully patched content in {args['filepath']}"
+               text=f"Successfully patched content in {filepath}"
            )
        ]
        
@@ -316,16 +486,18 @@ class PutContentToolHandler(ToolHandler):
        )
 
    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if "filepath" not in args or "content" not in args:
+       filepath = args.get("filepath")
+       content = args.get("content")
+       if not filepath or content is None:
            raise RuntimeError("filepath and content arguments required")
 
-       api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-       api.put_content(args.get("filepath", ""), args["content"])
+       api = _get_api()
+       api.put_content(filepath, content)
 
        return [
            TextContent(
                type="text",
-               text=f"Successfully uploaded content to {args['filepath']}"
+               text=f"Successfully uploaded content to {filepath}"
            )
        ]
    
@@ -357,30 +529,29 @@ class DeleteFileToolHandler(ToolHandler):
        )
 
    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if "filepath" not in args:
+       filepath = args.get("filepath")
+       if not filepath:
            raise RuntimeError("filepath argument missing in arguments")
-       
+
        if not args.get("confirm", False):
            raise RuntimeError("confirm must be set to true to delete a file")
 
-       api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-       api.delete_file(args["filepath"])
+       api = _get_api()
+       api.delete_file(filepath)
 
        return [
            TextContent(
                type="text",
-               text=f"Successfully deleted {args['filepath']}"
+               text=f"Successfully deleted {filepath}"
            )
        ]
    
-class ComplexSearchToolHandler(ToolHandler):
-   def __init__(self):
-       super().__init__("obsidian_complex_search")
-
-   def get_tool_description(self):
-       return Tool(
-           name=self.name,
-           description="""Complex search for documents using a JsonLogic query. 
+class ComplexSearchToolHandler(SpecToolHandler):
+   spec = ToolSpec(
+       name="obsidian_complex_search",
+       tool=Tool(
+           name="obsidian_complex_search",
+           description="""Complex search for documents using a JsonLogic query.
            Supports standard JsonLogic operators plus 'glob' and 'regexp' for pattern matching. Results must be non-falsy.
 
            Use this tool when you want to do a complex search, e.g. for all documents with certain tags etc.
@@ -421,29 +592,18 @@ class ComplexSearchToolHandler(ToolHandler):
                },
                "required": ["query"]
            }
-       )
-
-   def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if "query" not in args:
-           raise RuntimeError("query argument missing in arguments")
-
-       api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-       results = api.search_json(args.get("query", ""))
-
-       return [
-           TextContent(
-               type="text",
-               text=json.dumps(results, indent=2)
-           )
-       ]
-
-class BatchGetFileContentsToolHandler(ToolHandler):
-    def __init__(self):
-        super().__init__("obsidian_batch_get_file_contents")
-
-    def get_tool_description(self):
-        return Tool(
-            name=self.name,
+       ),
+       required_args=frozenset(("query",)),
+       api_method_name="search_json",
+       arg_names=("query",),
+       response_formatter=_format_json,
+   )
+
+class BatchGetFileContentsToolHandler(SpecToolHandler):
+    spec = ToolSpec(
+        name="obsidian_batch_get_file_contents",
+        tool=Tool(
+            name="obsidian_batch_get_file_contents",
             description="Return the contents of multiple files in your vault, concatenated with headers.",
             inputSchema={
                 "type": "object",
@@ -460,23 +620,16 @@ class BatchGetFileContentsToolHandler(ToolHandler):
                 },
                 "required": ["filepaths"]
             }
-        )
-
-    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "filepaths" not in args:
-            raise RuntimeError("filepaths argument missing in arguments")
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-        content = api.get_batch_file_contents(args["filepaths"])
-
-        return [
-            TextContent(
-                type="text",
-                text=content
-            )
-        ]
+        ),
+        required_args=frozenset(("filepaths",)),
+        api_method_name="iter_batch_file_contents",
+        arg_names=("filepaths",),
+        response_formatter=_format_batch_contents,
+    )
 
 class PeriodicNotesToolHandler(ToolHandler):
+    REQUIRED = frozenset(("period",))
+
     def __init__(self):
         super().__init__("obsidian_get_periodic_note")
 
@@ -504,20 +657,17 @@ class PeriodicNotesToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "period" not in args:
-            raise RuntimeError("period argument missing in arguments")
+        self._check_required(args)
 
         period = args["period"]
-        valid_periods = ["daily", "weekly", "monthly", "quarterly", "yearly"]
-        if period not in valid_periods:
-            raise RuntimeError(f"Invalid period: {period}. Must be one of: {', '.join(valid_periods)}")
-        
+        if period not in _VALID_PERIODS:
+            raise RuntimeError(f"Invalid period: {period}. Must be one of: {_VALID_PERIODS_MSG}")
+
         type = args["type"] if "type" in args else "content"
-        valid_types = ["content", "metadata"]
-        if type not in valid_types:
-            raise RuntimeError(f"Invalid type: {type}. Must be one of: {', '.join(valid_types)}")
+        if type not in _VALID_TYPES:
+            raise RuntimeError(f"Invalid type: {type}. Must be one of: {_VALID_TYPES_MSG}")
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         content = api.get_periodic_note(period,type)
 
         return [
@@ -528,6 +678,8 @@ class PeriodicNotesToolHandler(ToolHandler):
         ]
         
 class RecentPeriodicNotesToolHandler(ToolHandler):
+    REQUIRED = frozenset(("period",))
+
     def __init__(self):
         super().__init__("obsidian_get_recent_periodic_notes")
 
@@ -561,13 +713,11 @@ class RecentPeriodicNotesToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "period" not in args:
-            raise RuntimeError("period argument missing in arguments")
+        self._check_required(args)
 
         period = args["period"]
-        valid_periods = ["daily", "weekly", "monthly", "quarterly", "yearly"]
-        if period not in valid_periods:
-            raise RuntimeError(f"Invalid period: {period}. Must be one of: {', '.join(valid_periods)}")
+        if period not in _VALID_PERIODS:
+            raise RuntimeError(f"Invalid period: {period}. Must be one of: {_VALID_PERIODS_MSG}")
 
         limit = args.get("limit", 5)
         if not isinstance(limit, int) or limit < 1:
@@ -577,15 +727,10 @@ class RecentPeriodicNotesToolHandler(ToolHandler):
         if not isinstance(include_content, bool):
             raise RuntimeError(f"Invalid include_content: {include_content}. Must be a boolean")
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         results = api.get_recent_periodic_notes(period, limit, include_content)
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(results, indent=2)
-            )
-        ]
+        return self._respond(results)
         
 class RecentChangesToolHandler(ToolHandler):
     def __init__(self):
@@ -624,15 +769,10 @@ class RecentChangesToolHandler(ToolHandler):
         if not isinstance(days, int) or days < 1:
             raise RuntimeError(f"Invalid days: {days}. Must be a positive integer")
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         results = api.get_recent_changes(limit, days)
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(results, indent=2)
-            )
-        ]
+        return self._respond(results)
 
 # ==============================================================================
 # DISCOVERY AND ANALYSIS TOOLS
@@ -655,27 +795,46 @@ class AnalyzeVaultStructureToolHandler(ToolHandler):
                         "type": "boolean",
                         "description": "Whether to save detected patterns to vault configuration (default: true)",
                         "default": True
+                    },
+                    "force": {
+                        "type": "boolean",
+                        "description": "Whether to re-scan the vault even if a recent analysis is cached (default: false)",
+                        "default": False
+                    },
+                    "pretty": {
+                        "type": "boolean",
+                        "description": "Whether to indent the JSON response (default: false)",
+                        "default": False
                     }
                 }
             }
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .analyzers.structure import VaultStructureAnalyzer
-        from .config import get_config_manager
+        pretty = args.get("pretty", False)
+        config_mgr = get_config_manager()
+
+        # Warm runs reuse the last analysis instead of re-walking the vault.
+        if not args.get("force", False):
+            cached = config_mgr.get_cached_analysis()
+            if cached is not None:
+                cached = dict(cached)
+                cached["from_cache"] = True
+                cached["analyzed_at"] = config_mgr.last_analyzed_at.isoformat()
+                return self._respond(cached, pretty)
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-        analyzer = VaultStructureAnalyzer(api)
+        api = _get_api()
+        api.clear_request_cache()
+        analyzer = _structure_analyzer()
 
         # Analyze vault structure
         analysis = analyzer.analyze_vault_structure()
+        config_mgr.store_analysis(analysis)
 
         # Optionally save to config
         save_config = args.get("save_config", True)
         if save_config:
             try:
-                config_mgr = get_config_manager()
-
                 # Update config with detected patterns
                 daily_notes_data = analysis.get("daily_notes", {})
                 people_data = analysis.get("people", {})
@@ -705,17 +864,14 @@ class AnalyzeVaultStructureToolHandler(ToolHandler):
             except Exception as e:
                 analysis["config_error"] = f"Failed to save config: {str(e)}"
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(analysis, indent=2)
-            )
-        ]
+        return self._respond(analysis, pretty)
 
 
 class AnalyzeFrontmatterInFolderToolHandler(ToolHandler):
     """Analyzes frontmatter patterns in a specific folder."""
 
+    REQUIRED = frozenset(("folder_path",))
+
     def __init__(self):
         super().__init__("obsidian_analyze_frontmatter")
 
@@ -736,6 +892,16 @@ class AnalyzeFrontmatterInFolderToolHandler(ToolHandler):
                         "default": 20,
                         "minimum": 1,
                         "maximum": 100
+                    },
+                    "validate": {
+                        "type": "boolean",
+                        "description": "Use fully parsed frontmatter instead of the fast field scan (default: false)",
+                        "default": False
+                    },
+                    "pretty": {
+                        "type": "boolean",
+                        "description": "Whether to indent the JSON response (default: false)",
+                        "default": False
                     }
                 },
                 "required": ["folder_path"]
@@ -743,30 +909,26 @@ class AnalyzeFrontmatterInFolderToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .analyzers.frontmatter import FrontmatterAnalyzer
-
-        if "folder_path" not in args:
-            raise RuntimeError("folder_path argument missing")
+        self._check_required(args)
 
         folder_path = args["folder_path"]
         sample_size = args.get("sample_size", 20)
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-        analyzer = FrontmatterAnalyzer(api)
+        _get_api().clear_request_cache()
+        analyzer = _frontmatter_analyzer()
 
-        analysis = analyzer.analyze_frontmatter_in_folder(folder_path, sample_size)
+        analysis = analyzer.analyze_frontmatter_in_folder(
+            folder_path, sample_size, validate=args.get("validate", False)
+        )
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(analysis, indent=2)
-            )
-        ]
+        return self._respond(analysis, args.get("pretty", False))
 
 
 class SuggestFrontmatterForNoteToolHandler(ToolHandler):
     """Suggests frontmatter improvements for a specific note."""
 
+    REQUIRED = frozenset(("note_path",))
+
     def __init__(self):
         super().__init__("obsidian_suggest_frontmatter")
 
@@ -784,6 +946,11 @@ class SuggestFrontmatterForNoteToolHandler(ToolHandler):
                     "reference_folder": {
                         "type": "string",
                         "description": "Optional: Folder to use as reference for schema (default: note's parent folder)"
+                    },
+                    "pretty": {
+                        "type": "boolean",
+                        "description": "Whether to indent the JSON response (default: false)",
+                        "default": False
                     }
                 },
                 "required": ["note_path"]
@@ -791,30 +958,24 @@ class SuggestFrontmatterForNoteToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .analyzers.frontmatter import FrontmatterAnalyzer
-
-        if "note_path" not in args:
-            raise RuntimeError("note_path argument missing")
+        self._check_required(args)
 
         note_path = args["note_path"]
         reference_folder = args.get("reference_folder")
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-        analyzer = FrontmatterAnalyzer(api)
+        _get_api().clear_request_cache()
+        analyzer = _frontmatter_analyzer()
 
         suggestions = analyzer.suggest_frontmatter_for_note(note_path, reference_folder)
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(suggestions, indent=2)
-            )
-        ]
+        return self._respond(suggestions, args.get("pretty", False))
 
 
 class GetFolderContextToolHandler(ToolHandler):
     """Gets context and metadata about a specific folder."""
 
+    REQUIRED = frozenset(("folder_path",))
+
     def __init__(self):
         super().__init__("obsidian_get_folder_context")
 
@@ -828,6 +989,11 @@ class GetFolderContextToolHandler(ToolHandler):
                     "folder_path": {
                         "type": "string",
                         "description": "Path to folder (e.g., 'People', 'Projetos', 'Daily Notes')"
+                    },
+                    "pretty": {
+                        "type": "boolean",
+                        "description": "Whether to indent the JSON response (default: false)",
+                        "default": False
                     }
                 },
                 "required": ["folder_path"]
@@ -835,26 +1001,39 @@ class GetFolderContextToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .analyzers.structure import VaultStructureAnalyzer
-        from .analyzers.frontmatter import FrontmatterAnalyzer
-        from .config import get_config_manager
-
-        if "folder_path" not in args:
-            raise RuntimeError("folder_path argument missing")
+        self._check_required(args)
 
         folder_path = args["folder_path"]
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
+        api.clear_request_cache()
         config_mgr = get_config_manager()
 
-        # Get folder contents
+        # Get folder contents (cached so the frontmatter analyzer below
+        # doesn't re-list the same directory)
         try:
-            folder_contents = api.list_files_in_directory(folder_path)
+            folder_contents = api.cached_list_files_in_directory(folder_path)
             files = folder_contents.get("files", [])
-            md_files = [f for f in files if f.endswith(".md") and not f.endswith("/")]
-            subfolders = [f.rstrip("/") for f in files if f.endswith("/")]
+            # Partition and count in one pass: entries end with either "/"
+            # (folder) or an extension, so one suffix check per entry is
+            # enough and the statistics below reuse the same walk. Only the
+            # presentation caps are kept in memory; full totals are tracked
+            # by counters so a huge folder never materializes fully.
+            md_files: list[str] = []
+            subfolders: list[str] = []
+            md_count = 0
+            subfolder_count = 0
+            for f in files:
+                if f[-1] == "/":
+                    subfolder_count += 1
+                    if len(subfolders) < 20:
+                        subfolders.append(f[:-1])
+                elif f.endswith(".md"):
+                    md_count += 1
+                    if len(md_files) < 10:
+                        md_files.append(f)
         except Exception as e:
-            return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+            return self._respond({"error": str(e)})
 
         # Determine folder purpose based on config
         purpose = "Unknown"
@@ -873,19 +1052,44 @@ class GetFolderContextToolHandler(ToolHandler):
             detected_type = "people"
 
         # Check if it's a projects folder
-        project_folders = config_mgr.get_project_folders()
-        if any(folder_path.startswith(pf) for pf in project_folders):
+        project_folders = config_mgr.get_project_folder_prefixes()
+        if folder_path.startswith(project_folders):
             purpose = "Projects - Contains project documentation and work items"
             detected_type = "projects"
 
-        # Analyze frontmatter patterns (if not too many files)
+        # Analyze frontmatter patterns, tiered by folder size: tiny folders
+        # are scanned inline, mid-size folders get the full analyzer, and
+        # large folders are skipped with a pointer to the dedicated tool.
         frontmatter_analysis = None
-        if len(md_files) > 0 and len(md_files) <= 50:
-            analyzer = FrontmatterAnalyzer(api)
+        if 0 < md_count <= 2:
+            fields: set[str] = set()
+            for filename in md_files:
+                try:
+                    content = api.cached_get_file_contents(f"{folder_path}/{filename}")
+                except Exception:
+                    continue
+                block = _FRONTMATTER_BLOCK_RE.match(content)
+                if block:
+                    fields.update(
+                        key for key, _ in _FRONTMATTER_FIELD_RE.findall(block.group(1))
+                    )
+            frontmatter_analysis = {
+                "files_sampled": md_count,
+                "fields": sorted(fields)
+            }
+        elif 0 < md_count <= 50:
+            analyzer = _frontmatter_analyzer()
             frontmatter_analysis = analyzer.analyze_frontmatter_in_folder(
                 folder_path,
-                sample_size=min(20, len(md_files))
+                sample_size=min(20, md_count)
             )
+        else:
+            frontmatter_analysis = {
+                "skipped": (
+                    f"Folder has {md_count} markdown files; run "
+                    "obsidian_analyze_frontmatter for a sampled analysis."
+                )
+            }
 
         context = {
             "folder_path": folder_path,
@@ -893,20 +1097,15 @@ class GetFolderContextToolHandler(ToolHandler):
             "detected_type": detected_type,
             "statistics": {
                 "total_files": len(files),
-                "markdown_files": len(md_files),
-                "subfolders": len(subfolders)
+                "markdown_files": md_count,
+                "subfolders": subfolder_count
             },
-            "subfolders": subfolders[:20],  # Limit to first 20
-            "sample_files": md_files[:10],  # Limit to first 10
+            "subfolders": subfolders,  # Capped at 20 during the partition
+            "sample_files": md_files,  # Capped at 10 during the partition
             "frontmatter_patterns": frontmatter_analysis
         }
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(context, indent=2)
-            )
-        ]
+        return self._respond(context, args.get("pretty", False))
 
 # ==============================================================================
 # PEOPLE MANAGEMENT TOOLS
@@ -915,6 +1114,8 @@ class GetFolderContextToolHandler(ToolHandler):
 class CreatePersonToolHandler(ToolHandler):
     """Creates a new person note with structured frontmatter."""
 
+    REQUIRED = frozenset(("name",))
+
     def __init__(self):
         super().__init__("obsidian_create_person")
 
@@ -960,12 +1161,9 @@ class CreatePersonToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .knowledge.people import PeopleManager
-
-        if "name" not in args:
-            raise RuntimeError("name argument missing")
+        self._check_required(args)
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         manager = PeopleManager(api)
 
         name = args.pop("name")
@@ -973,7 +1171,7 @@ class CreatePersonToolHandler(ToolHandler):
 
         result = manager.create_person(name=name, content=content, **args)
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return self._respond(result)
 
 
 class ListPeopleToolHandler(ToolHandler):
@@ -1012,9 +1210,7 @@ class ListPeopleToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .knowledge.people import PeopleManager
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         manager = PeopleManager(api)
 
         include_frontmatter = args.get("include_frontmatter", False)
@@ -1033,12 +1229,14 @@ class ListPeopleToolHandler(ToolHandler):
             include_frontmatter=include_frontmatter
         )
 
-        return [TextContent(type="text", text=json.dumps(people, indent=2))]
+        return self._respond(people)
 
 
 class UpdatePersonToolHandler(ToolHandler):
     """Updates a person's note."""
 
+    REQUIRED = frozenset(("name",))
+
     def __init__(self):
         super().__init__("obsidian_update_person")
 
@@ -1075,12 +1273,9 @@ class UpdatePersonToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .knowledge.people import PeopleManager
+        self._check_required(args)
 
-        if "name" not in args:
-            raise RuntimeError("name argument missing")
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         manager = PeopleManager(api)
 
         name = args.pop("name")
@@ -1088,7 +1283,7 @@ class UpdatePersonToolHandler(ToolHandler):
 
         result = manager.update_person(name=name, append_content=append_content, **args)
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return self._respond(result)
 
 
 # ==============================================================================
@@ -1098,6 +1293,8 @@ class UpdatePersonToolHandler(ToolHandler):
 class CreateProjectToolHandler(ToolHandler):
     """Creates a new project note."""
 
+    REQUIRED = frozenset(("name",))
+
     def __init__(self):
         super().__init__("obsidian_create_project")
 
@@ -1150,12 +1347,9 @@ class CreateProjectToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .knowledge.projects import ProjectsManager
+        self._check_required(args)
 
-        if "name" not in args:
-            raise RuntimeError("name argument missing")
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         manager = ProjectsManager(api)
 
         name = args.pop("name")
@@ -1164,7 +1358,7 @@ class CreateProjectToolHandler(ToolHandler):
 
         result = manager.create_project(name=name, company=company, content=content, **args)
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return self._respond(result)
 
 
 class ListProjectsToolHandler(ToolHandler):
@@ -1199,9 +1393,7 @@ class ListProjectsToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .knowledge.projects import ProjectsManager
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         manager = ProjectsManager(api)
 
         company = args.get("company")
@@ -1218,7 +1410,7 @@ class ListProjectsToolHandler(ToolHandler):
             include_frontmatter=include_frontmatter
         )
 
-        return [TextContent(type="text", text=json.dumps(projects, indent=2))]
+        return self._respond(projects)
 
 
 class ListCompaniesToolHandler(ToolHandler):
@@ -1238,14 +1430,12 @@ class ListCompaniesToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .knowledge.projects import ProjectsManager
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         manager = ProjectsManager(api)
 
         companies = manager.list_companies()
 
-        return [TextContent(type="text", text=json.dumps({"companies": companies}, indent=2))]
+        return self._respond({"companies": companies})
 
 
 # ==============================================================================
@@ -1284,10 +1474,7 @@ class CreateDailyNoteToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .knowledge.daily import DailyNotesManager
-        from datetime import datetime
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         manager = DailyNotesManager(api)
 
         date = None
@@ -1306,12 +1493,14 @@ class CreateDailyNoteToolHandler(ToolHandler):
 
         result = manager.create_daily_note(date=date, use_template=use_template, **kwargs)
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return self._respond(result)
 
 
 class AppendToDailyNoteToolHandler(ToolHandler):
     """Appends content to a daily note."""
 
+    REQUIRED = frozenset(("content",))
+
     def __init__(self):
         super().__init__("obsidian_append_to_daily")
 
@@ -1340,13 +1529,9 @@ class AppendToDailyNoteToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .knowledge.daily import DailyNotesManager
-        from datetime import datetime
-
-        if "content" not in args:
-            raise RuntimeError("content argument missing")
+        self._check_required(args)
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         manager = DailyNotesManager(api)
 
         content = args["content"]
@@ -1361,7 +1546,7 @@ class AppendToDailyNoteToolHandler(ToolHandler):
 
         result = manager.append_to_daily_note(content=content, section=section, date=date)
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return self._respond(result)
 
 
 class GetRecentDailyNotesToolHandler(ToolHandler):
@@ -1394,9 +1579,7 @@ class GetRecentDailyNotesToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .knowledge.daily import DailyNotesManager
-
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         manager = DailyNotesManager(api)
 
         days = args.get("days", 7)
@@ -1404,7 +1587,7 @@ class GetRecentDailyNotesToolHandler(ToolHandler):
 
         notes = manager.get_recent_daily_notes(days=days, include_content=include_content)
 
-        return [TextContent(type="text", text=json.dumps(notes, indent=2))]
+        return self._respond(notes)
 
 
 # ============================================================================
@@ -1414,6 +1597,8 @@ class GetRecentDailyNotesToolHandler(ToolHandler):
 class SemanticSearchToolHandler(ToolHandler):
     """Semantic search for notes by meaning."""
 
+    REQUIRED = frozenset(("query",))
+
     def __init__(self):
         super().__init__("obsidian_semantic_search")
 
@@ -1457,7 +1642,7 @@ class SemanticSearchToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .semantic import EmbeddingsManager, SemanticSearchEngine
+        self._check_required(args)
 
         query = args["query"]
         top_k = args.get("top_k", 10)
@@ -1465,12 +1650,8 @@ class SemanticSearchToolHandler(ToolHandler):
         folder = args.get("folder")
         include_content = args.get("include_content", False)
 
-        # Initialize semantic search
-        embeddings_manager = EmbeddingsManager()
-        search_engine = SemanticSearchEngine(embeddings_manager)
-
         # Perform search
-        results = search_engine.search(
+        results = _search_engine().search(
             query=query,
             top_k=top_k,
             min_similarity=min_similarity,
@@ -1478,12 +1659,14 @@ class SemanticSearchToolHandler(ToolHandler):
             include_content=include_content
         )
 
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
+        return self._respond(results)
 
 
 class FindRelatedNotesToolHandler(ToolHandler):
     """Find notes related to a specific note."""
 
+    REQUIRED = frozenset(("filepath",))
+
     def __init__(self):
         super().__init__("obsidian_find_related_notes")
 
@@ -1518,35 +1701,32 @@ class FindRelatedNotesToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .semantic import EmbeddingsManager, SemanticSearchEngine, RelationshipAnalyzer
+        self._check_required(args)
 
         filepath = args["filepath"]
         top_k = args.get("top_k", 10)
         min_similarity = args.get("min_similarity", 0.6)
 
         # Get note content
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         content = api.get_file_contents(filepath)
 
-        # Initialize semantic search
-        embeddings_manager = EmbeddingsManager()
-        search_engine = SemanticSearchEngine(embeddings_manager)
-        relationship_analyzer = RelationshipAnalyzer(search_engine)
-
         # Find related notes
-        results = relationship_analyzer.find_related_notes(
+        results = _relationship_analyzer().find_related_notes(
             filepath=filepath,
             content=content,
             top_k=top_k,
             min_similarity=min_similarity
         )
 
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
+        return self._respond(results)
 
 
 class SuggestLinksToolHandler(ToolHandler):
     """Suggest links to add to a note."""
 
+    REQUIRED = frozenset(("filepath",))
+
     def __init__(self):
         super().__init__("obsidian_suggest_links")
 
@@ -1586,7 +1766,7 @@ class SuggestLinksToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .semantic import EmbeddingsManager, SemanticSearchEngine, RelationshipAnalyzer, LinkSuggestionEngine
+        self._check_required(args)
 
         filepath = args["filepath"]
         max_suggestions = args.get("max_suggestions", 10)
@@ -1594,17 +1774,11 @@ class SuggestLinksToolHandler(ToolHandler):
         check_existing = args.get("check_existing", True)
 
         # Get note content
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        api = _get_api()
         content = api.get_file_contents(filepath)
 
-        # Initialize link suggestion engine
-        embeddings_manager = EmbeddingsManager()
-        search_engine = SemanticSearchEngine(embeddings_manager)
-        relationship_analyzer = RelationshipAnalyzer(search_engine)
-        link_engine = LinkSuggestionEngine(relationship_analyzer)
-
         # Get suggestions
-        suggestions = link_engine.suggest_links_for_note(
+        suggestions = _link_engine().suggest_links_for_note(
             filepath=filepath,
             content=content,
             max_suggestions=max_suggestions,
@@ -1612,7 +1786,7 @@ class SuggestLinksToolHandler(ToolHandler):
             check_existing=check_existing
         )
 
-        return [TextContent(type="text", text=json.dumps(suggestions, indent=2))]
+        return self._respond(suggestions)
 
 
 class AnalyzeRelationshipsToolHandler(ToolHandler):
@@ -1659,18 +1833,13 @@ class AnalyzeRelationshipsToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .semantic import EmbeddingsManager, SemanticSearchEngine, RelationshipAnalyzer
-
         folder = args.get("folder")
         min_similarity = args.get("min_similarity", 0.7)
         find_clusters = args.get("find_clusters", True)
         find_bridges = args.get("find_bridges", False)
         find_isolated = args.get("find_isolated", False)
 
-        # Initialize relationship analyzer
-        embeddings_manager = EmbeddingsManager()
-        search_engine = SemanticSearchEngine(embeddings_manager)
-        relationship_analyzer = RelationshipAnalyzer(search_engine)
+        relationship_analyzer = _relationship_analyzer()
 
         result = {}
 
@@ -1713,7 +1882,7 @@ class AnalyzeRelationshipsToolHandler(ToolHandler):
                 "avg_connections": round(total_connections / total_notes, 2) if total_notes else 0
             }
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return self._respond(result)
 
 
 class RebuildEmbeddingsToolHandler(ToolHandler):
@@ -1743,13 +1912,35 @@ class RebuildEmbeddingsToolHandler(ToolHandler):
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        from .semantic import EmbeddingsManager, SemanticSearchEngine
-
         force = args.get("force", False)
         folder = args.get("folder")
 
+        api = _get_api()
+        search_engine = _search_engine()
+
+        # One DQL round-trip fetches every note's mtime; if the digest
+        # matches what the index was built from, nothing changed and the
+        # O(N) content fetch + hash diff can be skipped entirely.
+        manifest_hash = None
+        if not folder:
+            try:
+                manifest_hash = hashlib.sha256(api.get_vault_manifest()).hexdigest()
+            except Exception as e:
+                logger.debug(f"Vault manifest unavailable: {e}")
+
+        if (
+            manifest_hash
+            and not force
+            and manifest_hash == search_engine.get_manifest_hash()
+        ):
+            stats = search_engine.get_index_stats()
+            return self._respond({
+                "success": True,
+                "total_notes": stats.get("total_notes", 0),
+                "cached": True,
+            })
+
         # Get all notes
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
         vault_data = api.list_files_in_vault()
         all_files = vault_data.get("files", [])
 
@@ -1761,10 +1952,7 @@ class RebuildEmbeddingsToolHandler(ToolHandler):
             markdown_files = [f for f in markdown_files if f.startswith(folder)]
 
         if not markdown_files:
-            return [TextContent(
-                type="text",
-                text=json.dumps({"error": "No markdown files found"}, indent=2)
-            )]
+            return self._respond({"error": "No markdown files found"})
 
         # Get content for all files
         notes = []
@@ -1775,10 +1963,15 @@ class RebuildEmbeddingsToolHandler(ToolHandler):
             except Exception as e:
                 logger.error(f"Failed to get content for {filepath}: {e}")
 
-        # Build index
-        embeddings_manager = EmbeddingsManager()
-        search_engine = SemanticSearchEngine(embeddings_manager)
-
-        result = search_engine.build_index(notes, force=force)
+        # Build through the shared engine so its in-memory views (matrix,
+        # HNSW graph, query cache) are invalidated in place.
+        result = search_engine.build_index(
+            notes,
+            force=force,
+            manifest_hash=manifest_hash,
+            # Folder-scoped builds cover only part of the vault, so they
+            # must not evict the rest of the embeddings cache.
+            prune_missing=not folder,
+        )
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return self._respond(result)
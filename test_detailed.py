@@ -3,14 +3,12 @@
 Detailed tests for specific scenarios.
 """
 
-import os
 import json
+import sys
 
-# Set environment variables for remote API
-os.environ['OBSIDIAN_API_KEY'] = '07452926311ed660b8a3d309a2581979dbe404a393375635c20873e94aadb870'
-os.environ['OBSIDIAN_PROTOCOL'] = 'http'
-os.environ['OBSIDIAN_HOST'] = 'secondbrain.oihugudev.com.br'
-os.environ['OBSIDIAN_PORT'] = '80'
+# Shared environment setup; pytest applies it automatically at collection,
+# the import covers standalone `python test_detailed.py` runs.
+import conftest  # noqa: F401
 
 from src.mcp_obsidian import tools
 
@@ -26,7 +24,7 @@ def test_project_folder_context():
     result = handler.run_tool({"folder_path": "Projetos/BeSolution/CNI"})
 
     if result and len(result) > 0:
-        data = json.loads(result[0].text)
+        data = handler._last_result
         print(json.dumps(data, indent=2))
     else:
         print("No result")
@@ -46,7 +44,7 @@ def test_analyze_project_frontmatter():
     })
 
     if result and len(result) > 0:
-        data = json.loads(result[0].text)
+        data = handler._last_result
         print(json.dumps(data, indent=2))
     else:
         print("No result")
@@ -63,7 +61,7 @@ def test_daily_notes_folder_context():
     result = handler.run_tool({"folder_path": "Daily Notes"})
 
     if result and len(result) > 0:
-        data = json.loads(result[0].text)
+        data = handler._last_result
         print(json.dumps(data, indent=2))
     else:
         print("No result")
@@ -80,7 +78,7 @@ def test_analyze_vault_with_save():
     result = handler.run_tool({"save_config": True})
 
     if result and len(result) > 0:
-        data = json.loads(result[0].text)
+        data = handler._last_result
 
         print("\n📊 VAULT ANALYSIS COMPLETE")
         print(f"Config saved: {data.get('config_saved', False)}")
@@ -116,6 +114,10 @@ def test_analyze_vault_with_save():
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout so the run emits a few large writes instead of
+    # one syscall per print (noticeable on CI and remote terminals).
+    sys.stdout.reconfigure(line_buffering=False)
+
     test_project_folder_context()
     test_analyze_project_frontmatter()
     test_daily_notes_folder_context()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the frontmatter fast scan.
+
+The regex scan must agree with yaml.safe_load on the frontmatter shapes
+Obsidian actually produces — block-style lists and empty values in
+particular, which a newline-crossing pattern used to corrupt.
+"""
+
+# Shared environment setup; pytest applies it automatically at collection,
+# the import covers standalone runs.
+import conftest  # noqa: F401
+
+from src.mcp_obsidian.analyzers.frontmatter import _fast_frontmatter_fields
+
+
+def test_block_list_parses_as_array():
+    text = "---\ntags:\n  - person\n  - work\n---\n# Note\n"
+    assert _fast_frontmatter_fields(text) == {"tags": ["person", "work"]}
+
+
+def test_empty_value_does_not_swallow_next_field():
+    text = "---\naliases:\nstatus: active\n---\n"
+    fields = _fast_frontmatter_fields(text)
+    assert fields == {"aliases": None, "status": "active"}
+
+
+def test_inline_scalars_and_flow_list():
+    text = "---\ntitle: Hello\ncount: 3\nflag: true\nlist: [a, b]\n---\nbody"
+    assert _fast_frontmatter_fields(text) == {
+        "title": "Hello",
+        "count": 3,
+        "flag": True,
+        "list": ["a", "b"],
+    }
+
+
+def test_no_frontmatter_block():
+    assert _fast_frontmatter_fields("# Just a heading\n") == {}
@@ -7,12 +7,11 @@ Tests embeddings generation, semantic search, and relationship analysis.
 import os
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-# Set environment variables for remote API
-os.environ['OBSIDIAN_API_KEY'] = '07452926311ed660b8a3d309a2581979dbe404a393375635c20873e94aadb870'
-os.environ['OBSIDIAN_PROTOCOL'] = 'http'
-os.environ['OBSIDIAN_HOST'] = 'secondbrain.oihugudev.com.br'
-os.environ['OBSIDIAN_PORT'] = '80'
+# Shared environment setup; pytest applies it automatically at collection,
+# the import covers standalone `python test_phase2_semantic.py` runs.
+import conftest  # noqa: F401
 
 from src.mcp_obsidian import tools
 
@@ -34,7 +33,7 @@ def test_rebuild_embeddings():
     try:
         # Build index for entire vault
         result = handler.run_tool({"force": False})
-        data = json.loads(result[0].text)
+        data = handler._last_result
 
         if data.get("success"):
             print(f"✅ Index built successfully!")
@@ -73,16 +72,28 @@ def test_semantic_search():
         }
     ]
 
-    handler = tools.SemanticSearchToolHandler()
-
-    for i, query_params in enumerate(queries, 1):
-        print(f"\n📋 TEST 2.{i}: Search: '{query_params['query']}'")
-        if 'folder' in query_params:
-            print(f"   Folder: {query_params['folder']}")
-
-        try:
-            result = handler.run_tool(query_params)
-            data = json.loads(result[0].text)
+    def run_query(query_params):
+        # One handler per query: _last_result is per-instance, so
+        # concurrent queries don't clobber each other's payloads.
+        handler = tools.SemanticSearchToolHandler()
+        handler.run_tool(query_params)
+        return handler._last_result
+
+    # The queries are independent, so run them concurrently; wall clock
+    # tracks the slowest query instead of the sum.
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        futures = [executor.submit(run_query, q) for q in queries]
+
+        for i, (query_params, future) in enumerate(zip(queries, futures), 1):
+            print(f"\n📋 TEST 2.{i}: Search: '{query_params['query']}'")
+            if 'folder' in query_params:
+                print(f"   Folder: {query_params['folder']}")
+
+            try:
+                data = future.result()
+            except Exception as e:
+                print(f"❌ FAILED: {str(e)}")
+                return False
 
             if data:
                 print(f"✅ Found {len(data)} results:")
@@ -92,10 +103,6 @@ def test_semantic_search():
             else:
                 print("⚠️  No results found")
 
-        except Exception as e:
-            print(f"❌ FAILED: {str(e)}")
-            return False
-
     return True
 
 
@@ -124,7 +131,7 @@ def test_find_related_notes():
                 "top_k": test_case["top_k"],
                 "min_similarity": 0.6
             })
-            data = json.loads(result[0].text)
+            data = handler._last_result
 
             if data:
                 print(f"✅ Found {len(data)} related notes:")
@@ -158,7 +165,7 @@ def test_suggest_links():
             "max_suggestions": 5,
             "min_similarity": 0.7
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
 
         if data:
             print(f"✅ Found {len(data)} link suggestions:")
@@ -192,7 +199,7 @@ def test_analyze_relationships():
             "find_clusters": True,
             "find_isolated": True
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
 
         summary = data.get("summary", {})
         clusters = data.get("clusters", [])
@@ -276,4 +283,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout so the run emits a few large writes instead of
+    # one syscall per print (noticeable on CI and remote terminals).
+    sys.stdout.reconfigure(line_buffering=False)
     sys.exit(main())
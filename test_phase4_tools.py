@@ -7,13 +7,12 @@ Tests People, Projects, and Daily Notes management.
 import os
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Set environment variables for remote API
-os.environ['OBSIDIAN_API_KEY'] = '07452926311ed660b8a3d309a2581979dbe404a393375635c20873e94aadb870'
-os.environ['OBSIDIAN_PROTOCOL'] = 'http'
-os.environ['OBSIDIAN_HOST'] = 'secondbrain.oihugudev.com.br'
-os.environ['OBSIDIAN_PORT'] = '80'
+# Shared environment setup; pytest applies it automatically at collection,
+# the import covers standalone `python test_phase4_tools.py` runs.
+import conftest  # noqa: F401
 
 from src.mcp_obsidian import tools
 
@@ -33,7 +32,7 @@ def test_people_crud():
     handler = tools.ListPeopleToolHandler()
     try:
         result = handler.run_tool({"include_frontmatter": False})
-        data = json.loads(result[0].text)
+        data = handler._last_result
         print(f"✅ Found {len(data)} people in vault")
         if data:
             print(f"   Sample: {', '.join([p['name'] for p in data[:3]])}")
@@ -54,7 +53,7 @@ def test_people_crud():
             "tags": ["test", "mcp"],
             "content": "## Notes\n\nThis is a test person created by MCP tests."
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
 
         if "success" in data and data["success"]:
             print(f"✅ Created person: {data['path']}")
@@ -74,7 +73,7 @@ def test_people_crud():
             "role": "Updated Role",
             "append_content": "\n\n## Update\n\nPerson was updated via MCP."
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
 
         if "success" in data and data["success"]:
             print(f"✅ Updated person successfully")
@@ -91,7 +90,7 @@ def test_people_crud():
             "company": "Test Company",
             "include_frontmatter": True
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
         print(f"✅ Filtered list returned {len(data)} person(s)")
         if data and data[0].get('frontmatter'):
             print(f"   Frontmatter fields: {', '.join(data[0]['frontmatter'].keys())}")
@@ -110,7 +109,7 @@ def test_projects_crud():
     handler = tools.ListCompaniesToolHandler()
     try:
         result = handler.run_tool({})
-        data = json.loads(result[0].text)
+        data = handler._last_result
         companies = data.get('companies', [])
         print(f"✅ Found {len(companies)} companies")
         print(f"   Companies: {', '.join(companies)}")
@@ -123,7 +122,7 @@ def test_projects_crud():
     handler = tools.ListProjectsToolHandler()
     try:
         result = handler.run_tool({"include_frontmatter": False})
-        data = json.loads(result[0].text)
+        data = handler._last_result
         print(f"✅ Found {len(data)} projects")
         if data:
             # Group by company
@@ -155,7 +154,7 @@ def test_projects_crud():
             "tags": ["test", "automation"],
             "content": "## Overview\n\nThis is a test project created by MCP tests."
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
 
         if "success" in data and data["success"]:
             print(f"✅ Created project: {data['path']}")
@@ -174,7 +173,7 @@ def test_projects_crud():
             "company": "BeSolution",
             "include_frontmatter": False
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
         print(f"✅ Found {len(data)} projects in BeSolution")
         if data:
             print(f"   Sample: {', '.join([p['name'] for p in data[:3]])}")
@@ -196,7 +195,7 @@ def test_daily_notes():
             "use_template": True,
             "mentions": ["Test Person MCP"]
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
 
         if "success" in data and data["success"]:
             print(f"✅ Created daily note: {data['path']}")
@@ -215,7 +214,7 @@ def test_daily_notes():
             "content": "- Testando MCP Obsidian Phase 4",
             "section": "Notas Rápidas"
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
 
         if "success" in data and data["success"]:
             print(f"✅ Appended to section: {data.get('section', 'N/A')}")
@@ -232,7 +231,7 @@ def test_daily_notes():
             "days": 7,
             "include_content": False
         })
-        data = json.loads(result[0].text)
+        data = handler._last_result
         print(f"✅ Found {len(data)} daily notes in last 7 days")
         if data:
             for note in data[:3]:
@@ -248,17 +247,25 @@ def main():
     print(f"Remote API: {os.environ['OBSIDIAN_HOST']}")
     print("="*80)
 
-    results = {}
-
     # Run all tests
     print("\n⚠️  NOTE: Tests will create test data in your vault")
     print("   Test Person: 'Test Person MCP'")
     print("   Test Project: 'Test Project MCP' in BeSolution/")
     print("   Test Daily Note: Today's date with test content\n")
 
-    results['people'] = test_people_crud()
-    results['projects'] = test_projects_crud()
-    results['daily_notes'] = test_daily_notes()
+    # The three groups touch independent vault areas and spend their time
+    # on HTTP round-trips, so run them concurrently; wall clock drops to
+    # roughly the slowest group. Output lines may interleave.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            name: executor.submit(fn)
+            for name, fn in (
+                ('people', test_people_crud),
+                ('projects', test_projects_crud),
+                ('daily_notes', test_daily_notes),
+            )
+        }
+        results = {name: future.result() for name, future in futures.items()}
 
     # Summary
     print_separator("TEST SUMMARY")
@@ -283,4 +290,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout so the run emits a few large writes instead of
+    # one syscall per print (noticeable on CI and remote terminals).
+    sys.stdout.reconfigure(line_buffering=False)
     sys.exit(main())